@@ -2,23 +2,7 @@
 
 from django.db import migrations
 
-
-def create_unique_brands(apps, schema_editor):
-    shoe = apps.get_model('main_app', 'Shoe')
-    unique_brands = apps.get_model('main_app', 'UniqueBrands')
-    unique_brands_name = shoe.objects.values_list('brand', flat=True).distinct()
-
-    # for brand_name in unique_brands_name:
-    #     unique_brands.create(brand_name=brand_name)
-
-    unique_brands_to_create = [unique_brands(brand_name=brand_name) for brand_name in unique_brands_name]
-    unique_brands.objects.bulk_create(unique_brands_to_create)
-
-
-def delete_unique_brands(apps, schema_editor):
-    unique_brands = apps.get_model('main_app', 'UniqueBrands')
-
-    unique_brands.objects.all().delete()
+from main_app.operations import InsertDistinct
 
 
 class Migration(migrations.Migration):
@@ -27,5 +11,5 @@ class Migration(migrations.Migration):
     ]
 
     operations = [
-        migrations.RunPython(create_unique_brands, reverse_code=delete_unique_brands)
+        InsertDistinct('Shoe', 'UniqueBrands', field_map={'brand_name': 'brand'})
     ]
@@ -1,50 +1,33 @@
 # Generated by Django 5.0.4 on 2024-06-19 19:11
 
 from django.db import migrations
+from django.db.models import Case, Value, When
+from django.db.models.functions import Length
+from django.db.models.lookups import GreaterThan
 
+from main_app.operations import ChunkedUpdate
 
-def set_price(apps, schema_editor):
-    smartphone_model = apps.get_model('main_app', 'Smartphone')
-    smartphones = smartphone_model.objects.all()
-
-    for smartphone_record in smartphones:
-        smartphone_record.price = len(smartphone_record.brand) * 120
-        smartphone_record.save()
-
-    # smartphone_model.objects.bulk_update(smartphones, ['price'])
-
-
-def set_category(apps, schema_editor):
-    smartphone_model = apps.get_model('main_app', 'Smartphone')
-    smartphones = smartphone_model.objects.all()
-
-    for smartphone_records in smartphones:
-        if smartphone_records.price > 751:
-            smartphone_records.category = 'Expensive'
-        else:
-            smartphone_records.category = 'Cheap'
-        smartphone_records.save()
-
-
-def set_category_and_price(apps, schema_editor):
-    set_price(apps, schema_editor)
-    set_category(apps, schema_editor)
-
-
-def revers_code(apps, schema_editor):
-    smartphone_model = apps.get_model('main_app', 'Smartphone')
-    default_category = smartphone_model._meta.get_field('category').default
-
-    for smartphone in smartphone_model.objects.all():
-        smartphone.price = 0
-        smartphone.category = default_category
-        smartphone.save()
+NEW_PRICE = Length('brand') * 120
 
 
 class Migration(migrations.Migration):
+    atomic = False
+
     dependencies = [
         ('main_app', '0013_smartphone'),
     ]
 
-    operations = [migrations.RunPython(set_category_and_price, reverse_code=revers_code)
-                  ]
+    operations = [
+        # SET reads the old row values, so the category is derived from the
+        # new price expression rather than from the price column.
+        ChunkedUpdate(
+            'Smartphone',
+            forward={
+                'price': NEW_PRICE,
+                'category': Case(
+                    When(GreaterThan(NEW_PRICE, 751), then=Value('Expensive')),
+                    default=Value('Cheap'),
+                ),
+            },
+        ),
+    ]
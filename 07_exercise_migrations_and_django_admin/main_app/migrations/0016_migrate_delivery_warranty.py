@@ -1,38 +1,50 @@
 # Generated by Django 5.0.4 on 2024-06-19 19:45
 
-from django.db import migrations
-from django.utils import timezone
-
-
-def set_delivery_warranty(apps, schema_editor):
-    order_model = apps.get_model('main_app', 'Order')
-
-    for order in order_model.objects.all():
-        if order.status == 'Pending':
-            order.delivery = order.order_date + timezone.timedelta(days=3)
-            order.save()
-        elif order.status == 'Completed':
-            order.warranty = 24
-            order.save()
-        else:
-            order.delete()
+from datetime import timedelta
 
+from django.db import migrations
+from django.db.models import Case, DateField, ExpressionWrapper, F, Q, Value, When
 
-def reverse_code(apps, schema_editor):
-    order_model = apps.get_model('main_app', 'Order')
-    for order in order_model.objects.all():
-        if order.status == 'Pending':
-            order.delivery = None
-        elif order.status == 'Completed':
-            order.warranty = "No warranty"
-        order.save()
+from main_app.operations import ChunkedDelete, ChunkedUpdate
 
 
 class Migration(migrations.Migration):
+    atomic = False
+
     dependencies = [
         ('main_app', '0015_order'),
     ]
 
     operations = [
-        migrations.RunPython(set_delivery_warranty, reverse_code=reverse_code)
+        ChunkedUpdate(
+            'Order',
+            condition=Q(status__in=('Pending', 'Completed')),
+            forward={
+                'delivery': Case(
+                    When(
+                        status='Pending',
+                        then=ExpressionWrapper(F('order_date') + timedelta(days=3), output_field=DateField()),
+                    ),
+                    default=F('delivery'),
+                ),
+                'warranty': Case(
+                    When(status='Completed', then=Value('24')),
+                    default=F('warranty'),
+                ),
+            },
+            backward={
+                'delivery': Case(
+                    When(status='Pending', then=Value(None)),
+                    default=F('delivery'),
+                ),
+                'warranty': Case(
+                    When(status='Completed', then=Value('No warranty')),
+                    default=F('warranty'),
+                ),
+            },
+        ),
+        ChunkedDelete(
+            'Order',
+            condition=~Q(status__in=('Pending', 'Completed')),
+        ),
     ]
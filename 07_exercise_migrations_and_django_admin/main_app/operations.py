@@ -0,0 +1,189 @@
+import sys
+
+from django.db import connections, transaction
+from django.db.migrations.operations.base import Operation
+from django.db.models import Max, Min, Q
+from django.db.models.constants import OnConflict
+
+
+class _ChunkedOperation(Operation):
+    reduces_to_sql = False
+    reversible = True
+
+    def __init__(self, model_name: str, condition: Q = None, chunk_size: int = 10_000, progress: bool = True):
+        self.model_name = model_name
+        self.condition = condition
+        self.chunk_size = chunk_size
+        self.progress = progress
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def _deconstruct_kwargs(self) -> dict:
+        kwargs = {'model_name': self.model_name}
+        if self.condition is not None:
+            kwargs['condition'] = self.condition
+        if self.chunk_size != 10_000:
+            kwargs['chunk_size'] = self.chunk_size
+        if not self.progress:
+            kwargs['progress'] = self.progress
+        return kwargs
+
+    def _run_in_chunks(self, model, alias: str, action) -> int:
+        queryset = model._base_manager.db_manager(alias).all()
+        if self.condition is not None:
+            queryset = queryset.filter(self.condition)
+
+        bounds = queryset.aggregate(low=Min('pk'), high=Max('pk'))
+        if bounds['low'] is None:
+            return 0
+
+        low, high = bounds['low'], bounds['high']
+        processed = 0
+
+        # Each pk range runs in its own (sub)transaction so locks are held for
+        # one chunk at a time when the migration itself is not atomic.
+        for start in range(low, high + 1, self.chunk_size):
+            with transaction.atomic(using=alias):
+                processed += action(queryset.filter(pk__gte=start, pk__lt=start + self.chunk_size))
+            self._report(model, min(start + self.chunk_size - 1, high), high, processed)
+
+        return processed
+
+    def _report(self, model, current_pk: int, high: int, processed: int):
+        if self.progress:
+            sys.stdout.write(
+                f'\n    {model._meta.object_name}: pk {current_pk}/{high}, {processed} rows affected'
+            )
+            sys.stdout.flush()
+
+
+class ChunkedUpdate(_ChunkedOperation):
+    """
+    Applies ``forward`` (field -> expression) with one UPDATE per pk range.
+
+    When ``backward`` is omitted, reversing resets the forward fields to their
+    model defaults.
+    """
+
+    def __init__(self, model_name: str, forward: dict, backward: dict = None, **kwargs):
+        super().__init__(model_name, **kwargs)
+        self.forward = forward
+        self.backward = backward
+
+    def deconstruct(self):
+        kwargs = self._deconstruct_kwargs()
+        kwargs['forward'] = self.forward
+        if self.backward is not None:
+            kwargs['backward'] = self.backward
+        return self.__class__.__qualname__, [], kwargs
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        model = to_state.apps.get_model(app_label, self.model_name)
+        self._update(model, schema_editor.connection.alias, self.forward)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        model = from_state.apps.get_model(app_label, self.model_name)
+        backward = self.backward
+        if backward is None:
+            backward = {name: model._meta.get_field(name).get_default() for name in self.forward}
+        self._update(model, schema_editor.connection.alias, backward)
+
+    def _update(self, model, alias: str, assignments: dict):
+        if self.allow_migrate_model(alias, model):
+            self._run_in_chunks(model, alias, lambda chunk: chunk.update(**assignments))
+
+    def describe(self):
+        return f"Chunked update of {', '.join(self.forward)} on {self.model_name}"
+
+
+class ChunkedDelete(_ChunkedOperation):
+    """
+    Deletes the rows matching ``condition`` one pk range at a time.
+    Deleted rows cannot be restored, so reversing is a no-op.
+    """
+
+    def deconstruct(self):
+        return self.__class__.__qualname__, [], self._deconstruct_kwargs()
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        model = to_state.apps.get_model(app_label, self.model_name)
+        alias = schema_editor.connection.alias
+        if self.allow_migrate_model(alias, model):
+            self._run_in_chunks(model, alias, lambda chunk: chunk.delete()[0])
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        pass
+
+    def describe(self):
+        return f'Chunked delete on {self.model_name}'
+
+
+def insert_distinct(source_model, target_model, field_map: dict, using: str = 'default') -> int:
+    """
+    INSERT INTO target (...) SELECT DISTINCT ... FROM source, skipping rows that would
+    violate a unique constraint on the target, so it can be re-run to pick up new values.
+    ``field_map`` maps target field names to source field names.
+    """
+    connection = connections[using]
+    target_fields = [target_model._meta.get_field(name) for name in field_map]
+
+    select = source_model._base_manager.db_manager(using).values_list(*field_map.values()).distinct().order_by()
+    select_sql, select_params = select.query.get_compiler(using=using).as_sql()
+
+    table = connection.ops.quote_name(target_model._meta.db_table)
+    columns = ', '.join(connection.ops.quote_name(field.column) for field in target_fields)
+    insert = connection.ops.insert_statement(on_conflict=OnConflict.IGNORE)
+    suffix = connection.ops.on_conflict_suffix_sql(target_fields, OnConflict.IGNORE, None, None)
+
+    with connection.cursor() as cursor:
+        cursor.execute(f'{insert} {table} ({columns}) {select_sql} {suffix}', select_params)
+        return cursor.rowcount
+
+
+class InsertDistinct(Operation):
+    """
+    Migration operation around insert_distinct(). Reversing deletes the target rows whose
+    values still exist in the source.
+    """
+    reduces_to_sql = False
+    reversible = True
+
+    def __init__(self, source_model_name: str, target_model_name: str, field_map: dict):
+        self.source_model_name = source_model_name
+        self.target_model_name = target_model_name
+        self.field_map = field_map
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def deconstruct(self):
+        kwargs = {
+            'source_model_name': self.source_model_name,
+            'target_model_name': self.target_model_name,
+            'field_map': self.field_map,
+        }
+        return self.__class__.__qualname__, [], kwargs
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        source_model = to_state.apps.get_model(app_label, self.source_model_name)
+        target_model = to_state.apps.get_model(app_label, self.target_model_name)
+        alias = schema_editor.connection.alias
+        if self.allow_migrate_model(alias, target_model):
+            insert_distinct(source_model, target_model, self.field_map, using=alias)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        source_model = from_state.apps.get_model(app_label, self.source_model_name)
+        target_model = from_state.apps.get_model(app_label, self.target_model_name)
+        alias = schema_editor.connection.alias
+        if not self.allow_migrate_model(alias, target_model):
+            return
+
+        targets = target_model._base_manager.db_manager(alias).all()
+        for target_name, source_name in self.field_map.items():
+            source_values = source_model._base_manager.db_manager(alias).values(source_name)
+            targets = targets.filter(**{f'{target_name}__in': source_values})
+        targets.delete()
+
+    def describe(self):
+        return f'Insert distinct {self.source_model_name} values into {self.target_model_name}'
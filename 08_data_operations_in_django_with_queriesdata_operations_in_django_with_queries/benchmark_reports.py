@@ -0,0 +1,74 @@
+import os
+import resource
+import sys
+import time
+
+import django
+
+# Set up Django
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "orm_skeleton.settings")
+django.setup()
+
+from main_app.models import Student
+from caller import stream_students_info
+
+# Peak RSS is a per-process high-water mark, so every mode has to run in its own process:
+#   python benchmark_reports.py seed 1000000
+#   python benchmark_reports.py list
+#   python benchmark_reports.py stream
+
+BATCH_SIZE = 10_000
+
+
+def seed_students(total: int):
+    existing = Student.objects.count()
+    for start in range(existing, total, BATCH_SIZE):
+        Student.objects.bulk_create(
+            Student(
+                student_id=f'B{number:09d}',
+                first_name='First',
+                last_name=f'Last{number}',
+                email=f'student{number}@university.com',
+            )
+            for number in range(start, min(start + BATCH_SIZE, total))
+        )
+
+
+def build_report_as_list(output):
+    lines = [
+        f'Student №{s.student_id}: {s.first_name} {s.last_name}; Email: {s.email}'
+        for s in Student.objects.all()
+    ]
+    output.write('\n'.join(lines))
+
+
+def build_report_streaming(output):
+    for line in stream_students_info():
+        output.write(line)
+        output.write('\n')
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is reported in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+if __name__ == '__main__':
+    mode = sys.argv[1] if len(sys.argv) > 1 else 'stream'
+
+    if mode == 'seed':
+        seed_students(int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000)
+        print(f'Students in table: {Student.objects.count()}')
+        sys.exit()
+
+    builders = {'list': build_report_as_list, 'stream': build_report_streaming}
+    rss_before = peak_rss_mb()
+    started = time.perf_counter()
+
+    with open(os.devnull, 'w', encoding='utf-8') as devnull:
+        builders[mode](devnull)
+
+    print(
+        f'{mode}: {Student.objects.count()} rows in {time.perf_counter() - started:.2f}s, '
+        f'peak RSS {peak_rss_mb():.1f} MB (startup {rss_before:.1f} MB)'
+    )
@@ -9,6 +9,8 @@ os.environ.setdefault("DJANGO_SETTINGS_MODULE", "orm_skeleton.settings")
 django.setup()
 
 # Import your models here
+from main_app.bulk_operations import replace_in_column
+from main_app.ingestion import bulk_ingest
 from main_app.models import Student
 
 
@@ -48,21 +50,26 @@ def add_students():
     )
 
 
+def add_students_bulk(students, batch_size: int = 5000) -> list:
+    # students: iterable of dicts or a CSV stream with student_id,first_name,last_name,birth_date,email
+    return bulk_ingest(Student, students, batch_size=batch_size)
+
+
+def stream_students_info(chunk_size: int = 2000):
+    students = Student.objects.values_list(
+        'student_id', 'first_name', 'last_name', 'email'
+    ).iterator(chunk_size=chunk_size)
+
+    for student_id, first_name, last_name, email in students:
+        yield f'Student №{student_id}: {first_name} {last_name}; Email: {email}'
+
+
 def get_students_info():
-    students = Student.objects.all()
-    result = []
-    for current_student in students:
-        result.append(
-            f'Student №{current_student.student_id}: {current_student.first_name} {current_student.last_name}; Email: {current_student.email}')
-    return '\n'.join(result)
+    return '\n'.join(stream_students_info())
 
 
 def update_students_emails():
-    students = Student.objects.all()
-    for _student in students:
-        # _student.email = _student.email.split('@')[0] + '@uni-students.com'
-        _student.email = _student.email.replace('university.com', 'uni-students.com')
-    Student.objects.bulk_update(students, ['email'])
+    return replace_in_column(Student.objects.all(), 'email', 'university.com', 'uni-students.com')
 
 
 def truncate_students():
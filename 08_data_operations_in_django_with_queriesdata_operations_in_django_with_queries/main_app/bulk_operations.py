@@ -0,0 +1,28 @@
+from django.db import transaction
+from django.db.models import F, QuerySet, Value
+from django.db.models.functions import Replace
+
+
+def replace_in_column(queryset: QuerySet, field_name: str, old: str, new: str, chunk_size: int = 5000) -> list:
+    """
+    Server-side UPDATE field = REPLACE(field, old, new), run over consecutive primary key
+    ranges of at most ``chunk_size`` matching rows so each statement holds its locks briefly.
+    Returns the number of rows affected per chunk.
+    """
+    queryset = queryset.filter(**{f'{field_name}__contains': old})
+    rows_per_chunk = []
+    last_pk = None
+
+    while True:
+        remaining = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+        upper_pk = remaining.order_by('pk').values_list('pk', flat=True)[chunk_size - 1:chunk_size].first()
+        chunk = remaining if upper_pk is None else remaining.filter(pk__lte=upper_pk)
+
+        with transaction.atomic(using=queryset.db):
+            affected = chunk.update(**{field_name: Replace(F(field_name), Value(old), Value(new))})
+
+        if affected:
+            rows_per_chunk.append(affected)
+        if upper_pk is None:
+            return rows_per_chunk
+        last_pk = upper_pk
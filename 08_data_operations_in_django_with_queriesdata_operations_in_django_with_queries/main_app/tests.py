@@ -0,0 +1,34 @@
+import io
+
+from django.db import connection
+from django.test import TestCase
+
+from main_app.ingestion import _copy_csv, bulk_ingest
+from main_app.models import Student
+
+
+class CopyCsvTests(TestCase):
+    def test_none_is_an_unquoted_empty_field_and_empty_string_is_quoted(self):
+        fields = [Student._meta.get_field(name) for name in ('student_id', 'first_name', 'birth_date', 'email')]
+        student = Student(student_id='FC1', first_name='', birth_date=None, email='say "hi"@example.com')
+
+        self.assertEqual(
+            _copy_csv(fields, [student], connection),
+            '"FC1","",,"say ""hi""@example.com"\n',
+        )
+
+
+class BulkIngestTests(TestCase):
+    def test_missing_and_empty_birth_dates_are_stored_as_null(self):
+        stream = io.StringIO(
+            'student_id,first_name,last_name,birth_date,email\n'
+            'FC1,John,Doe,2000-01-01,john@example.com\n'
+            'FC2,Jane,Doe,,jane@example.com\n'
+        )
+        bulk_ingest(Student, stream)
+        bulk_ingest(Student, [{'student_id': 'FC3', 'first_name': 'Jim', 'last_name': 'Doe', 'email': 'jim@example.com'}])
+
+        self.assertEqual(
+            dict(Student.objects.values_list('student_id', 'birth_date__year')),
+            {'FC1': 2000, 'FC2': None, 'FC3': None},
+        )
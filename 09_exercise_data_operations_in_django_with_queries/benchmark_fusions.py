@@ -0,0 +1,52 @@
+import os
+import sys
+import time
+
+import django
+
+# Set up Django
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "orm_skeleton.settings")
+django.setup()
+
+from main_app.models import Character
+from caller import fuse_characters, fuse_characters_bulk
+
+#   python benchmark_fusions.py 5000
+
+
+def create_pairs(count: int) -> list:
+    characters = Character.objects.bulk_create(
+        Character(
+            name=f'Hero{number}',
+            class_name=('Mage', 'Warrior', 'Assassin', 'Scout')[number % 4],
+            level=10,
+            strength=15,
+            dexterity=20,
+            intelligence=25,
+            hit_points=100,
+            inventory='Staff of Magic, Spellbook',
+        )
+        for number in range(count * 2)
+    )
+    return list(zip(characters[::2], characters[1::2]))
+
+
+def fuse_per_pair(pairs):
+    for first_character, second_character in pairs:
+        fuse_characters(first_character, second_character)
+
+
+def measure(name: str, fuse, count: int):
+    pairs = create_pairs(count)
+    started = time.perf_counter()
+    fuse(pairs)
+    elapsed = time.perf_counter() - started
+    print(f'{name:>9}: {count} pairs in {elapsed:.2f}s ({count / elapsed:,.0f} pairs/s)')
+    Character.objects.filter(name__startswith='Hero').delete()
+
+
+if __name__ == '__main__':
+    pairs_count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+
+    measure('per pair', fuse_per_pair, pairs_count)
+    measure('bulk', fuse_characters_bulk, pairs_count)
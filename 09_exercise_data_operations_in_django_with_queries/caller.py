@@ -1,10 +1,15 @@
 import os
+from decimal import Decimal
+
 import django
 
 # Set up Django
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "orm_skeleton.settings")
 django.setup()
-from django.db.models import F, Q
+from django.db import connection, transaction
+from django.db.models import F, Q, Value, DecimalField, ExpressionWrapper
+from main_app.functions import DigitSum
+from main_app.ingestion import bulk_ingest
 from main_app.models import Pet, Artifact, Location, Car, Task, HotelRoom, Character
 
 
@@ -14,6 +19,11 @@ def create_pet(name: str, species: str):
     return f"{pet.name} is a very cute {pet.species}!"
 
 
+def create_pets_bulk(pets, batch_size: int = 5000) -> list:
+    # pets: iterable of {'name': ..., 'species': ...} dicts or a CSV stream with that header
+    return bulk_ingest(Pet, pets, batch_size=batch_size)
+
+
 # 02. Artifact ----------------------------------------------------------------
 def create_artifact(
         name: str,
@@ -32,6 +42,10 @@ def create_artifact(
     return f"The artifact {artifact.name} is {artifact.age} years old!"
 
 
+def create_artifacts_bulk(artifacts, batch_size: int = 5000) -> list:
+    return bulk_ingest(Artifact, artifacts, batch_size=batch_size)
+
+
 def rename_artifact(
         artifact: Artifact,
         new_name: str
@@ -46,12 +60,14 @@ def delete_all_artifacts():
 
 
 # 03. Location ----------------------------------------------------------------
+def stream_all_locations(chunk_size: int = 2000):
+    locations = Location.objects.order_by('-id').values_list('name', 'population').iterator(chunk_size=chunk_size)
+    for name, population in locations:
+        yield f'{name} has a population of {population}!'
+
+
 def show_all_locations():
-    locations_models = Location.objects.all().order_by('-id')
-    result = []
-    for location in locations_models:
-        result.append(f'{location.name} has a population of {location.population}!')
-    return '\n'.join(result)
+    return '\n'.join(stream_all_locations())
 
 
 def new_capital():
@@ -71,11 +87,32 @@ def delete_first_location():
 
 # 04. Car ----------------------------------------------------------------
 def apply_discount():
-    cars = Car.objects.all()
-    for car in cars:
-        discount = sum(int(x) for x in str(car.year))
-        car.price_with_discount = car.price - car.price * discount / 100
-        car.save()
+    if connection.vendor in DigitSum.supported_vendors:
+        Car.objects.update(
+            price_with_discount=ExpressionWrapper(
+                F('price') - F('price') * DigitSum('year') * Value(Decimal('0.01')),
+                output_field=DecimalField(max_digits=10, decimal_places=2)
+            )
+        )
+    else:
+        apply_discount_in_chunks()
+
+
+def apply_discount_in_chunks(chunk_size: int = 2000):
+    cars = Car.objects.only('id', 'year', 'price').order_by('id')
+    last_id = 0
+
+    while True:
+        chunk = list(cars.filter(id__gt=last_id)[:chunk_size])
+        if not chunk:
+            break
+
+        for car in chunk:
+            discount = sum(int(x) for x in str(car.year))
+            car.price_with_discount = car.price - car.price * discount / 100
+
+        Car.objects.bulk_update(chunk, ['price_with_discount'])
+        last_id = chunk[-1].id
 
 
 def get_recent_cars():
@@ -87,20 +124,21 @@ def delete_last_car():
 
 
 # 05. Task Encoder ----------------------------------------------------------------
+def stream_unfinished_tasks(chunk_size: int = 2000):
+    unfinished_tasks = Task.objects.filter(is_finished=False).values_list(
+        'title', 'due_date'
+    ).iterator(chunk_size=chunk_size)
+
+    for title, due_date in unfinished_tasks:
+        yield f'Task - {title} needs to be done until {due_date}!'
+
+
 def show_unfinished_tasks():
-    unfinished_tasks = Task.objects.filter(is_finished=False)
-    result = []
-    for task in unfinished_tasks:
-        result.append(f'Task - {task.title} needs to be done until {task.due_date}!')
-    return '\n'.join(result)
+    return '\n'.join(stream_unfinished_tasks())
 
 
 def complete_odd_tasks():
-    odd_tasks = Task.objects.all()
-    for task in odd_tasks:
-        if task.id % 2 != 0:
-            task.is_finished = True
-            task.save()
+    Task.objects.filter(id__mod=(2, 1)).update(is_finished=True)
 
 
 def encode_and_replace(text: str, task_title: str):
@@ -115,17 +153,33 @@ def encode_and_replace(text: str, task_title: str):
 
 # 06. Hotel Room ----------------------------------------------------------------
 def get_deluxe_rooms():
-    rooms = HotelRoom.objects.all().filter(room_type='Deluxe')
-    result = []
-
-    for room in rooms:
-        if room.id % 2 == 0:
-            result.append(room)
-    return '\n'.join(str(r) for r in result)
+    rooms = HotelRoom.objects.filter(room_type='Deluxe', id__mod=(2, 0))
+    return '\n'.join(str(r) for r in rooms)
 
 
 def increase_room_capacity():
-    rooms = HotelRoom.objects.all()
+    # Every reserved room gets the running total of the reserved capacities up to it (by id)
+    # plus the id of the first reserved room - the same result as the loop below, in one UPDATE.
+    table = connection.ops.quote_name(HotelRoom._meta.db_table)
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            UPDATE {table}
+            SET capacity = running.new_capacity
+            FROM (
+                SELECT id,
+                       SUM(capacity) OVER (ORDER BY id) + FIRST_VALUE(id) OVER (ORDER BY id) AS new_capacity
+                FROM {table}
+                WHERE is_reserved
+            ) AS running
+            WHERE {table}.id = running.id
+            """
+        )
+
+
+def increase_room_capacity_iteratively():
+    rooms = HotelRoom.objects.all().order_by('id')
 
     previous_room_capacity = None
 
@@ -171,32 +225,29 @@ value2.
 """
 
 
-def update_characters() -> None:
-    Character.objects.filter(class_name='Mage').update(
-        level=F('level') + 3,
-        intelligence=F('intelligence') - 7
-    )
+UPDATE_CHARACTERS_RULES = (
+    (('Mage',), {'level': F('level') + 3, 'intelligence': F('intelligence') - 7}),
+    (('Warrior',), {'hit_points': F('hit_points') / 2, 'dexterity': F('dexterity') + 4}),
+    (('Assassin', 'Scout'), {'inventory': 'The inventory is empty'}),
+)
 
-    Character.objects.filter(class_name='Warrior').update(
-        hit_points=F('hit_points') / 2,
-        dexterity=F('dexterity') + 4
-    )
+GRAND_DEXTERITY_RULES = ((None, {'dexterity': 30}),)
+GRAND_INTELLIGENCE_RULES = ((None, {'intelligence': 40}),)
+GRAND_STRENGTH_RULES = ((None, {'strength': 50}),)
 
-    Character.objects.filter(class_name__in=["Assassin", "Scout"]).update(
-        inventory='The inventory is empty'
-    )
 
-    # Character.objects.filter(Q(class_name='Assassin') | Q(class_name='Scout').update(
-    #     inventory='The inventory is empty'
-    # )
+def update_characters() -> None:
+    # Rule sets can be combined, e.g. apply_stat_rules(UPDATE_CHARACTERS_RULES, GRAND_STRENGTH_RULES),
+    # to scan and lock the table once.
+    Character.objects.apply_stat_rules(UPDATE_CHARACTERS_RULES)
 
 
-def fuse_characters(first_character: Character, second_character: Character):
+def _fused_character(first_character: Character, second_character: Character) -> Character:
     if first_character.class_name in ['Mage', 'Scout']:
         new_inventory = "Bow of the Elven Lords, Amulet of Eternal Wisdom"
     else:
         new_inventory = "Dragon Scale Armor, Excalibur"
-    Character.objects.create(
+    return Character(
         name=first_character.name + ' ' + second_character.name,
         class_name='Fusion',
         level=(first_character.level + second_character.level) // 2,
@@ -206,20 +257,36 @@ def fuse_characters(first_character: Character, second_character: Character):
         hit_points=(first_character.hit_points + second_character.hit_points),
         inventory=new_inventory
     )
+
+
+def fuse_characters(first_character: Character, second_character: Character):
+    _fused_character(first_character, second_character).save()
     first_character.delete()
     second_character.delete()
 
 
+def fuse_characters_bulk(pairs, batch_size: int = 1000) -> list:
+    pairs = list(pairs)
+    fused = [_fused_character(first, second) for first, second in pairs]
+    fused_ids = {character.pk for pair in pairs for character in pair}
+
+    with transaction.atomic():
+        created = Character.objects.bulk_create(fused, batch_size=batch_size)
+        Character.objects.filter(pk__in=fused_ids).delete()
+
+    return created
+
+
 def grand_dexterity():
-    Character.objects.update(dexterity=30)
+    Character.objects.apply_stat_rules(GRAND_DEXTERITY_RULES)
 
 
 def grand_intelligence():
-    Character.objects.update(intelligence=40)
+    Character.objects.apply_stat_rules(GRAND_INTELLIGENCE_RULES)
 
 
 def grand_strength():
-    Character.objects.update(strength=50)
+    Character.objects.apply_stat_rules(GRAND_STRENGTH_RULES)
 
 
 def delete_characters():
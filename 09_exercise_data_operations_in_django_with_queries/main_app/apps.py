@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class MainAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'main_app'
+
+    def ready(self):
+        from main_app.lookups import Modulo
+
+        for model_name in ('Task', 'HotelRoom'):
+            self.get_model(model_name)._meta.pk.register_lookup(Modulo)
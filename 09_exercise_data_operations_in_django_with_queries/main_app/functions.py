@@ -0,0 +1,31 @@
+from django.db import NotSupportedError
+from django.db.models import Func, IntegerField
+
+
+# 04. Car ----------------------------------------------------------------
+class DigitSum(Func):
+    """
+    Sum of the decimal digits of a non-negative integer expression,
+    e.g. DigitSum('year') -> 2 + 0 + 2 + 4 for 2024.
+    """
+    function = 'DIGIT_SUM'
+    arity = 1
+    output_field = IntegerField()
+    supported_vendors = ('postgresql', 'sqlite')
+
+    # PositiveIntegerField values fit in 10 digits
+    max_digits = 10
+
+    def as_sql(self, compiler, connection, **extra_context):
+        raise NotSupportedError(f'DigitSum is not supported on {connection.vendor}.')
+
+    def _as_integer_arithmetic(self, compiler, connection):
+        value_sql, value_params = compiler.compile(self.source_expressions[0])
+        terms = [f'(({value_sql}) / {10 ** i}) %% 10' for i in range(self.max_digits)]
+        return f"({' + '.join(terms)})", value_params * self.max_digits
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        return self._as_integer_arithmetic(compiler, connection)
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        return self._as_integer_arithmetic(compiler, connection)
@@ -0,0 +1,18 @@
+from django.db.models import Lookup
+
+
+class Modulo(Lookup):
+    """
+    field__mod=(divisor, remainder) -> field % divisor = remainder
+    """
+    lookup_name = 'mod'
+    prepare_rhs = False
+
+    def get_prep_lookup(self):
+        divisor, remainder = self.rhs
+        return int(divisor), int(remainder)
+
+    def as_sql(self, compiler, connection):
+        lhs_sql, lhs_params = self.process_lhs(compiler, connection)
+        divisor, remainder = self.rhs
+        return f'{lhs_sql} %% %s = %s', (*lhs_params, divisor, remainder)
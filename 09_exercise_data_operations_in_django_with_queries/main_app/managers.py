@@ -0,0 +1,45 @@
+from django.db import models
+from django.db.models import Case, F, Value, When
+
+
+# 07. Character ----------------------------------------------------------------
+class CharacterManager(models.Manager):
+
+    def apply_stat_rules(self, *rule_sets) -> int:
+        """
+        Compiles rule sets into a single UPDATE ... SET field = CASE class_name ... statement.
+
+        A rule set is an iterable of (class_names, {field: value_or_expression}) pairs;
+        class_names=None applies the assignments to every class. When several rules assign
+        the same field for the same class, the last one wins.
+        """
+        rules = [rule for rule_set in rule_sets for rule in rule_set]
+        assignments = {}
+
+        for field_name in dict.fromkeys(field for _, values in rules for field in values):
+            whens = []
+            default = F(field_name)
+
+            for class_names, values in reversed(rules):
+                if field_name not in values:
+                    continue
+                value = values[field_name]
+                if not hasattr(value, 'resolve_expression'):
+                    value = Value(value)
+                if class_names is None:
+                    default = value
+                    break
+                whens.append(When(class_name__in=class_names, then=value))
+
+            if whens:
+                default = Case(*whens, default=default, output_field=self.model._meta.get_field(field_name))
+            assignments[field_name] = default
+
+        if not assignments:
+            return 0
+
+        queryset = self.all()
+        if all(class_names is not None for class_names, _ in rules):
+            queryset = queryset.filter(class_name__in={name for class_names, _ in rules for name in class_names})
+
+        return queryset.update(**assignments)
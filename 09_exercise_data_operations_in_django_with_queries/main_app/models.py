@@ -1,5 +1,7 @@
 from django.db import models
 
+from main_app.managers import CharacterManager
+
 
 # Create your models here.
 # 01. Pet ----------------------------------------------------------------
@@ -82,6 +84,8 @@ class Character(models.Model):
     hit_points = models.PositiveIntegerField()
     inventory = models.TextField()
 
+    objects = CharacterManager()
+
 
 
 
@@ -1,3 +1,55 @@
+from decimal import Decimal
+
 from django.test import TestCase
 
-# Create your tests here.
+from caller import increase_room_capacity, increase_room_capacity_iteratively
+from main_app.ingestion import _copy_value
+from main_app.models import HotelRoom
+
+
+class IncreaseRoomCapacityTests(TestCase):
+    def setUp(self):
+        rooms = HotelRoom.objects.bulk_create(
+            HotelRoom(
+                room_number=100 + number,
+                room_type='Standard',
+                capacity=number % 4 + 1,
+                amenities='TV',
+                price_per_night=Decimal('100.00'),
+                is_reserved=number % 3 != 1,
+            )
+            for number in range(12)
+        )
+        # gaps in the ids, including before the first reserved room
+        HotelRoom.objects.filter(pk__in=[rooms[0].pk, rooms[4].pk, rooms[5].pk, rooms[9].pk]).delete()
+        self.initial_capacities = dict(HotelRoom.objects.values_list('pk', 'capacity'))
+
+    def capacities_after(self, implementation) -> dict:
+        HotelRoom.objects.bulk_update(
+            [HotelRoom(pk=pk, capacity=capacity) for pk, capacity in self.initial_capacities.items()],
+            ['capacity'],
+        )
+        implementation()
+        return dict(HotelRoom.objects.values_list('pk', 'capacity'))
+
+    def test_set_based_update_matches_iterative_update(self):
+        iterative = self.capacities_after(increase_room_capacity_iteratively)
+        set_based = self.capacities_after(increase_room_capacity)
+
+        self.assertEqual(set_based, iterative)
+        self.assertNotEqual(set_based, self.initial_capacities)
+
+    def test_unreserved_rooms_keep_their_capacity(self):
+        set_based = self.capacities_after(increase_room_capacity)
+
+        for room_id in HotelRoom.objects.filter(is_reserved=False).values_list('pk', flat=True):
+            self.assertEqual(set_based[room_id], self.initial_capacities[room_id])
+
+
+class CopyValueTests(TestCase):
+    def test_null_and_empty_string_stay_distinct(self):
+        # COPY (FORMAT csv) reads an unquoted empty field as NULL
+        self.assertEqual(_copy_value(None), '')
+        self.assertEqual(_copy_value(''), '""')
+        self.assertEqual(_copy_value('Staff "of" Magic'), '"Staff ""of"" Magic"')
+        self.assertEqual(_copy_value(250), '"250"')
@@ -0,0 +1,48 @@
+import os
+import sys
+import time
+
+import django
+
+# Set up Django
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "orm_skeleton.settings")
+django.setup()
+
+from django.db.models.functions import ExtractYear
+from django.db.models.lookups import Range
+
+from main_app.models import Author
+
+#   python manage.py seed_dataset --scale 10m
+#   python benchmark_birth_year.py 1950 1960
+
+REPEATS = 20
+
+
+def extract_year_filter(from_year: int, to_year: int):
+    # What birth_date__year__range compiled to before the YearRange lookup
+    return Author.objects.filter(Range(ExtractYear('birth_date'), (from_year, to_year)))
+
+
+def date_range_filter(from_year: int, to_year: int):
+    return Author.objects.filter(birth_date__year__range=(from_year, to_year))
+
+
+def measure(name: str, queryset):
+    print(f'--- {name}')
+    print(queryset.explain())
+
+    started = time.perf_counter()
+    for _ in range(REPEATS):
+        count = queryset.count()
+    elapsed = (time.perf_counter() - started) / REPEATS
+    print(f'{count} authors, {elapsed * 1000:.1f} ms per query\n')
+
+
+if __name__ == '__main__':
+    from_year = int(sys.argv[1]) if len(sys.argv) > 1 else 1950
+    to_year = int(sys.argv[2]) if len(sys.argv) > 2 else from_year + 10
+
+    print(f'Authors in table: {Author.objects.count()}\n')
+    measure('EXTRACT(year)', extract_year_filter(from_year, to_year))
+    measure('birth_date range', date_range_filter(from_year, to_year))
@@ -7,6 +7,8 @@ os.environ.setdefault("DJANGO_SETTINGS_MODULE", "orm_skeleton.settings")
 django.setup()
 
 # Import your models
+from django.db.models import Avg, Count
+from main_app.linking import link_reviews
 from main_app.models import Author, Book, Review
 
 
@@ -82,6 +84,8 @@ def add_records_to_database():
     Author.objects.bulk_create(authors)
     Book.objects.bulk_create(books)
     Review.objects.bulk_create(reviews)
+    # bulk_create skips Review.save(), which links reviews to their book and author
+    link_reviews(Review, Book, Author)
     return "Records added to tables Authors, Books and Reviews"
 
 
@@ -183,4 +187,17 @@ def change_reviewer_name(reviewer_name, new_name):
 # print(change_reviewer_name("Bob Wilson", "Bobby W."))
 # print()
 # print("Change A.J. to A. Johnson:")
-# print(change_reviewer_name("A.J.", "A. Johnson"))
\ No newline at end of file
+# print(change_reviewer_name("A.J.", "A. Johnson"))
+
+
+# 08. Average Rating per Book ----------------------------------------------------------------
+def average_rating_per_book():
+    # Joins reviews through the indexed Review.book foreign key instead of matching title strings
+    books = Book.objects.annotate(
+        reviews_count=Count('reviews'), average_rating=Avg('reviews__rating')
+    ).filter(reviews_count__gt=0).order_by('-average_rating', 'title')
+
+    return '\n'.join(f'{book}: {book.average_rating:.2f} ({book.reviews_count} reviews)' for book in books)
+
+
+# print(average_rating_per_book())
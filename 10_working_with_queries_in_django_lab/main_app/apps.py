@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class MainAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'main_app'
+
+    def ready(self):
+        from django.db.models.functions import ExtractYear
+        from main_app.lookups import YearRange
+
+        ExtractYear.register_lookup(YearRange)
@@ -0,0 +1,35 @@
+from django.db import transaction
+from django.db.models import Max, Min, OuterRef, Q, Subquery, Value
+from django.db.models.functions import StrIndex, Substr
+
+
+def link_reviews(review_model, book_model, author_model, batch_size: int = 10_000, using: str = 'default') -> int:
+    """
+    Sets Review.book / Review.author from the book_title / author_name strings with one
+    UPDATE per pk range; the correlated lookups use the book (title, author) and author
+    (first_name, last_name) indexes. Only rows that are still unlinked are touched, so it is
+    safe to re-run. Returns the number of links written.
+    """
+    reviews = review_model._base_manager.db_manager(using).filter(Q(book__isnull=True) | Q(author__isnull=True))
+    bounds = reviews.aggregate(low=Min('pk'), high=Max('pk'))
+    if bounds['low'] is None:
+        return 0
+
+    books = book_model._base_manager.db_manager(using).filter(
+        title=OuterRef('book_title'), author=OuterRef('author_name')
+    ).order_by('pk').values('pk')[:1]
+
+    # "First Last" -> first_name="First", last_name="Last", as in Review.save()
+    space = StrIndex(OuterRef('author_name'), Value(' '))
+    authors = author_model._base_manager.db_manager(using).filter(
+        first_name=Substr(OuterRef('author_name'), 1, space - 1),
+        last_name=Substr(OuterRef('author_name'), space + 1),
+    ).order_by('pk').values('pk')[:1]
+
+    updated = 0
+    for start in range(bounds['low'], bounds['high'] + 1, batch_size):
+        chunk = reviews.filter(pk__gte=start, pk__lt=start + batch_size)
+        with transaction.atomic(using=using):
+            updated += chunk.filter(book__isnull=True).update(book=Subquery(books))
+            updated += chunk.filter(author__isnull=True, author_name__contains=' ').update(author=Subquery(authors))
+    return updated
@@ -0,0 +1,21 @@
+from django.db.models.lookups import Range, YearLookup
+
+
+class YearRange(YearLookup, Range):
+    """
+    date_field__year__range=(from_year, to_year) compiled as
+    date_field >= Jan 1 from_year AND date_field < Jan 1 (to_year + 1)
+    instead of EXTRACT(year ...) BETWEEN ..., so an index on the column can be used.
+    """
+    prepare_rhs = False
+
+    def as_sql(self, compiler, connection):
+        # rhs is always a tuple, so rhs_is_direct_value() cannot spot expression bounds
+        if any(hasattr(year, 'resolve_expression') for year in self.rhs):
+            return Range.as_sql(self, compiler, connection)
+
+        lhs_sql, params = self.process_lhs(compiler, connection, self.lhs.lhs)
+        from_year, to_year = (int(year) for year in self.rhs)
+        start, _ = self.year_lookup_bounds(connection, from_year)
+        end, _ = self.year_lookup_bounds(connection, to_year + 1)
+        return f'{lhs_sql} >= %s AND {lhs_sql} < %s', (*params, start, *params, end)
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from main_app.linking import link_reviews
+from main_app.models import Author, Book, Review
+
+
+class Command(BaseCommand):
+    help = 'Links reviews to their Book and Author rows by title and author name.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=10_000)
+
+    def handle(self, *args, **options):
+        updated = link_reviews(Review, Book, Author, batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Linked {updated} review fields.'))
@@ -0,0 +1,37 @@
+# Generated by Django 5.0.4 on 2026-10-18 13:45
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='review',
+            name='author',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='reviews', to='main_app.author'),
+        ),
+        migrations.AddField(
+            model_name='review',
+            name='book',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='reviews', to='main_app.book'),
+        ),
+        migrations.AlterField(
+            model_name='review',
+            name='reviewer_name',
+            field=models.CharField(db_index=True, max_length=100),
+        ),
+        migrations.AddIndex(
+            model_name='author',
+            index=models.Index(fields=['first_name', 'last_name'], name='author_full_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='book',
+            index=models.Index(fields=['title', 'author'], name='book_title_author_idx'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.0.4 on 2026-10-18 13:50
+
+from django.db import migrations
+
+from main_app.linking import link_reviews
+
+
+def link_existing_reviews(apps, schema_editor):
+    link_reviews(
+        apps.get_model('main_app', 'Review'),
+        apps.get_model('main_app', 'Book'),
+        apps.get_model('main_app', 'Author'),
+        using=schema_editor.connection.alias,
+    )
+
+
+class Migration(migrations.Migration):
+    # Every batch commits on its own; link_reviews only touches unlinked rows, so it can be re-run
+    atomic = False
+
+    dependencies = [
+        ('main_app', '0002_review_book_author_links'),
+    ]
+
+    operations = [
+        migrations.RunPython(link_existing_reviews, reverse_code=migrations.RunPython.noop),
+    ]
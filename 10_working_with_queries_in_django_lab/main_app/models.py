@@ -4,10 +4,15 @@ from django.db import models
 class Author(models.Model):
     first_name = models.CharField(max_length=50)
     last_name = models.CharField(max_length=50)
-    birth_date = models.DateField(null=True, blank=True)
+    birth_date = models.DateField(null=True, blank=True, db_index=True)
     nationality = models.CharField(max_length=50, null=True, blank=True)
     biography = models.TextField(null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['first_name', 'last_name'], name='author_full_name_idx'),
+        ]
+
     def __str__(self):
         return f"{self.first_name} {self.last_name}"
 
@@ -20,17 +25,54 @@ class Book(models.Model):
     language = models.CharField(max_length=50, null=True, blank=True)
     page_count = models.PositiveIntegerField(null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['title', 'author'], name='book_title_author_idx'),
+        ]
+
     def __str__(self):
         return f"{self.title} by {self.author}"
 
 
 class Review(models.Model):
-    reviewer_name = models.CharField(max_length=100)
+    reviewer_name = models.CharField(max_length=100, db_index=True)
     book_title = models.CharField(max_length=100)
     author_name = models.CharField(max_length=100)
     rating = models.PositiveIntegerField()
     comment = models.TextField(null=True, blank=True)
     created_on = models.DateTimeField(auto_now_add=True, editable=False)
+    # Resolved from book_title/author_name; rows written with bulk_create are linked by
+    # `python manage.py link_reviews`
+    book = models.ForeignKey(Book, on_delete=models.SET_NULL, null=True, blank=True, related_name='reviews')
+    author = models.ForeignKey(Author, on_delete=models.SET_NULL, null=True, blank=True, related_name='reviews')
+
+    LINK_NAMES = ('book_title', 'author_name')
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # the names the links were resolved from, so save() can tell when they were edited
+        instance._loaded_names = {name: value for name, value in zip(field_names, values) if name in cls.LINK_NAMES}
+        return instance
+
+    def save(self, *args, **kwargs):
+        loaded = getattr(self, '_loaded_names', {})
+        author_changed = loaded.get('author_name', self.author_name) != self.author_name
+        book_changed = author_changed or loaded.get('book_title', self.book_title) != self.book_title
+
+        if self.book_id is None or book_changed:
+            self.book = Book.objects.filter(title=self.book_title, author=self.author_name).first()
+        if self.author_id is None or author_changed:
+            first_name, _, last_name = self.author_name.partition(' ')
+            self.author = Author.objects.filter(first_name=first_name, last_name=last_name).first()
+
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and set(self.LINK_NAMES).intersection(update_fields):
+            kwargs['update_fields'] = {*update_fields, 'book', 'author'}
+        super().save(*args, **kwargs)
+
+        saved = self.LINK_NAMES if update_fields is None else set(self.LINK_NAMES).intersection(update_fields)
+        self._loaded_names = {**loaded, **{name: getattr(self, name) for name in saved}}
 
     def __str__(self):
         return f"Review by {self.reviewer_name}"
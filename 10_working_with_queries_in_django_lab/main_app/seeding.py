@@ -0,0 +1,98 @@
+import random
+from datetime import date, timedelta
+from itertools import islice
+
+from django.db import transaction
+
+from main_app.linking import link_reviews
+from main_app.models import Author, Book, Review
+
+# Number of reviews (the largest table) per scale; authors and books are derived from it
+SCALES = {
+    '1k': 1_000,
+    '100k': 100_000,
+    '10m': 10_000_000,
+}
+
+FIRST_NAMES = ('John', 'Jane', 'Michael', 'Sarah', 'Maria', 'Emily', 'Laura', 'Robert', 'Alice', 'Paulo')
+LAST_NAMES = ('Smith', 'Johnson', 'Brown', 'Lee', 'Garcia', 'White', 'Hall', 'Miller', 'Roberts', 'Coelho')
+NATIONALITIES = ('American', 'British', 'Australian', 'Spanish', 'Brazilian', None)
+GENRES = ('Mystery', 'Fantasy', 'Science Fiction', 'Fiction', 'Romance', 'Poetry', None)
+LANGUAGES = ('English', 'Spanish', 'Portuguese', None)
+REVIEWERS = ('Alice Johnson', 'Bob Wilson', 'Samuel White', 'Carol Adams', 'Daniel Harris')
+
+
+def _author_name(index: int) -> tuple:
+    return FIRST_NAMES[index % len(FIRST_NAMES)], f'{LAST_NAMES[index // len(FIRST_NAMES) % len(LAST_NAMES)]}{index}'
+
+
+def _book(index: int, authors_count: int) -> tuple:
+    # (title, author full name) - derived from the index so reviews can reference books without keeping them
+    first_name, last_name = _author_name(index * 7919 % authors_count)
+    return f'Book {index}', f'{first_name} {last_name}'
+
+
+def _authors(rng: random.Random, count: int):
+    for index in range(count):
+        first_name, last_name = _author_name(index)
+        yield Author(
+            first_name=first_name,
+            last_name=last_name,
+            birth_date=date(1900, 1, 1) + timedelta(days=rng.randrange(40_000)) if rng.random() < 0.8 else None,
+            nationality=rng.choice(NATIONALITIES),
+        )
+
+
+def _books(rng: random.Random, count: int, authors_count: int):
+    for index in range(count):
+        title, author = _book(index, authors_count)
+        yield Book(
+            title=title,
+            author=author,
+            publication_year=rng.randrange(1800, 2025),
+            genre=rng.choice(GENRES),
+            language=rng.choice(LANGUAGES),
+            page_count=rng.randrange(80, 1200) if rng.random() < 0.9 else None,
+        )
+
+
+def _reviews(rng: random.Random, count: int, books_count: int, authors_count: int):
+    for _ in range(count):
+        book_title, author_name = _book(rng.randrange(books_count), authors_count)
+        yield Review(
+            reviewer_name=rng.choice(REVIEWERS),
+            book_title=book_title,
+            author_name=author_name,
+            rating=rng.randint(1, 5),
+        )
+
+
+def _insert(model, objects, batch_size: int) -> int:
+    inserted = 0
+    while True:
+        batch = list(islice(objects, batch_size))
+        if not batch:
+            return inserted
+        with transaction.atomic():
+            model.objects.bulk_create(batch)
+        inserted += len(batch)
+
+
+def seed(scale: str = '1k', seed_value: int = 0, batch_size: int = 10_000) -> dict:
+    """
+    Generates a deterministic Author/Book/Review dataset: the same scale and seed always produce
+    the same rows. Returns the number of rows inserted per model.
+    """
+    reviews_count = SCALES[scale]
+    books_count = max(reviews_count // 4, 1)
+    authors_count = max(reviews_count // 20, 1)
+    rng = random.Random(seed_value)
+
+    counts = {
+        'authors': _insert(Author, _authors(rng, authors_count), batch_size),
+        'books': _insert(Book, _books(rng, books_count, authors_count), batch_size),
+        'reviews': _insert(Review, _reviews(rng, reviews_count, books_count, authors_count), batch_size),
+    }
+    # bulk_create skips Review.save(), which links reviews to their book and author
+    link_reviews(Review, Book, Author, batch_size=batch_size)
+    return counts
@@ -0,0 +1,96 @@
+from datetime import date
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db.models import F, Value
+from django.test import TestCase
+
+from main_app.models import Author, Book, Review
+
+
+class YearRangeLookupTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        for birth_date in (date(1979, 12, 31), date(1980, 1, 1), date(1990, 12, 31), date(1991, 1, 1)):
+            Author.objects.create(first_name='First', last_name=str(birth_date), birth_date=birth_date)
+
+    def test_literal_years_filter_on_date_bounds(self):
+        authors = Author.objects.filter(birth_date__year__range=(1980, 1990))
+
+        self.assertNotIn('EXTRACT', str(authors.query).upper())
+        self.assertEqual(
+            sorted(authors.values_list('birth_date', flat=True)),
+            [date(1980, 1, 1), date(1990, 12, 31)],
+        )
+
+    def test_expression_bounds_fall_back_to_extract(self):
+        self.assertEqual(Author.objects.filter(birth_date__year__range=(Value(1980), 1990)).count(), 2)
+        self.assertEqual(Author.objects.filter(birth_date__year__range=(F('id'), F('id'))).count(), 0)
+
+
+class SeedDatasetCommandTests(TestCase):
+    def seed(self, *args):
+        call_command('seed_dataset', *args, stdout=StringIO())
+        return Author.objects.count(), Book.objects.count(), Review.objects.count()
+
+    def test_refuses_to_seed_over_existing_rows(self):
+        counts = self.seed()
+
+        with self.assertRaisesMessage(CommandError, 'run again with --clear'):
+            self.seed()
+        self.assertEqual((Author.objects.count(), Book.objects.count(), Review.objects.count()), counts)
+
+    def test_clear_replaces_the_dataset(self):
+        counts = self.seed()
+
+        self.assertEqual(self.seed('--clear'), counts)
+        self.assertFalse(Review.objects.filter(book__isnull=True).exists())
+
+
+class ReviewLinkTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.jane = Author.objects.create(first_name='Jane', last_name='Austen')
+        cls.emily = Author.objects.create(first_name='Emily', last_name='Bronte')
+        cls.emma = Book.objects.create(title='Emma', author='Jane Austen', publication_year=1815)
+        cls.persuasion = Book.objects.create(title='Persuasion', author='Jane Austen', publication_year=1817)
+        cls.heights = Book.objects.create(title='Wuthering Heights', author='Emily Bronte', publication_year=1847)
+
+    def create_review(self):
+        return Review.objects.create(reviewer_name='Alice', book_title='Emma', author_name='Jane Austen', rating=4)
+
+    def test_links_are_resolved_on_create(self):
+        review = self.create_review()
+
+        self.assertEqual((review.book, review.author), (self.emma, self.jane))
+
+    def test_editing_the_title_relinks_the_book(self):
+        review = Review.objects.get(pk=self.create_review().pk)
+
+        review.book_title = 'Persuasion'
+        review.save()
+
+        review.refresh_from_db()
+        self.assertEqual((review.book, review.author), (self.persuasion, self.jane))
+
+    def test_editing_the_author_name_relinks_both(self):
+        review = self.create_review()
+
+        review.book_title = 'Wuthering Heights'
+        review.author_name = 'Emily Bronte'
+        review.save(update_fields=['book_title', 'author_name'])
+
+        review.refresh_from_db()
+        self.assertEqual((review.book, review.author), (self.heights, self.emily))
+
+    def test_unchanged_names_keep_the_links(self):
+        review = Review.objects.get(pk=self.create_review().pk)
+        Review.objects.filter(pk=review.pk).update(book=self.persuasion)
+        review.refresh_from_db()
+
+        review.rating = 5
+        review.save()
+
+        review.refresh_from_db()
+        self.assertEqual(review.book, self.persuasion)
@@ -0,0 +1,53 @@
+import os
+import sys
+import time
+
+import django
+
+# Set up Django
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "orm_skeleton.settings")
+django.setup()
+
+from main_app.models import Artist, Song
+from caller import add_song_to_artist, remove_song_from_artist, add_songs_to_artists, remove_songs_from_artists
+
+#   python benchmark_song_links.py 5000
+
+SONGS_PER_ARTIST = 3
+
+
+def create_pairs(count: int) -> list:
+    artists_count = max(count // SONGS_PER_ARTIST, 1)
+    Artist.objects.bulk_create(Artist(name=f'Bench Artist {number}') for number in range(artists_count))
+    Song.objects.bulk_create(Song(title=f'Bench Song {number}') for number in range(count))
+    return [(f'Bench Artist {number % artists_count}', f'Bench Song {number}') for number in range(count)]
+
+
+def add_per_pair(pairs):
+    for artist_name, song_title in pairs:
+        add_song_to_artist(artist_name, song_title)
+
+
+def remove_per_pair(pairs):
+    for artist_name, song_title in pairs:
+        remove_song_from_artist(artist_name, song_title)
+
+
+def measure(name: str, operation, pairs: list):
+    started = time.perf_counter()
+    operation(pairs)
+    elapsed = time.perf_counter() - started
+    print(f'{name:>17}: {len(pairs)} pairs in {elapsed:.2f}s ({len(pairs) / elapsed:,.0f} pairs/s)')
+
+
+if __name__ == '__main__':
+    pairs_count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    pairs = create_pairs(pairs_count)
+
+    measure('add per pair', add_per_pair, pairs)
+    measure('remove per pair', remove_per_pair, pairs)
+    measure('add bulk', add_songs_to_artists, pairs)
+    measure('remove bulk', remove_songs_from_artists, pairs)
+
+    Artist.objects.filter(name__startswith='Bench Artist ').delete()
+    Song.objects.filter(title__startswith='Bench Song ').delete()
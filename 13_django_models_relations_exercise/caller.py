@@ -5,6 +5,8 @@ import django
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "orm_skeleton.settings")
 django.setup()
 
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Prefetch
 from main_app.models import Author, Book, Artist, Song, Product, Review, DrivingLicense, Driver, Owner, Registration, \
     Car
 
@@ -12,13 +14,17 @@ from main_app.models import Author, Book, Artist, Song, Product, Review, Driving
 # 01. Library ----------------------------------------------------------------
 
 def show_all_authors_with_their_books() -> str:
-    result = []
-    for author in Author.objects.all():
-        books = author.book_set.all()
-        if books:
-            result.append(f"{author.name} has written - {', '.join(book.title for book in books)}!")
+    # Two queries regardless of the number of authors: authors that have books, then all their titles
+    authors = Author.objects.filter(
+        Exists(Book.objects.filter(author=OuterRef('pk')))
+    ).order_by('pk').prefetch_related(
+        Prefetch('book_set', queryset=Book.objects.only('title', 'author_id').order_by('pk'), to_attr='books')
+    )
 
-    return '\n'.join(result)
+    return '\n'.join(
+        f"{author.name} has written - {', '.join(book.title for book in author.books)}!"
+        for author in authors
+    )
 
 
 def delete_all_authors_without_books() -> None:
@@ -69,6 +75,61 @@ def add_song_to_artist(artist_name: str, song_title: str) -> None:
     # song.artists.add(artist)
 
 
+def _resolve_artist_song_pairs(pairs: list) -> tuple:
+    # One IN query per side; unknown names raise like the get() calls of the per-pair functions
+    artist_names = {artist_name for artist_name, _ in pairs}
+    song_titles = {song_title for _, song_title in pairs}
+
+    artist_ids = dict(Artist.objects.filter(name__in=artist_names).values_list('name', 'pk'))
+    song_ids = dict(Song.objects.filter(title__in=song_titles).values_list('title', 'pk'))
+
+    if missing := artist_names - artist_ids.keys():
+        raise Artist.DoesNotExist(f"Artists not found: {', '.join(sorted(missing))}")
+    if missing := song_titles - song_ids.keys():
+        raise Song.DoesNotExist(f"Songs not found: {', '.join(sorted(missing))}")
+
+    return artist_ids, song_ids
+
+
+def add_songs_to_artists(pairs, batch_size: int = 1000) -> None:
+    """
+    Bulk add_song_to_artist() for an iterable of (artist_name, song_title) pairs.
+    Writes the through table directly, so no m2m_changed signals are sent.
+    """
+    pairs = list(pairs)
+    artist_ids, song_ids = _resolve_artist_song_pairs(pairs)
+
+    links = {(artist_ids[artist_name], song_ids[song_title]) for artist_name, song_title in pairs}
+    ArtistSong = Artist.songs.through
+    ArtistSong.objects.bulk_create(
+        [ArtistSong(artist_id=artist_id, song_id=song_id) for artist_id, song_id in links],
+        batch_size=batch_size,
+        ignore_conflicts=True,
+    )
+
+
+def remove_songs_from_artists(pairs) -> int:
+    """
+    Bulk remove_song_from_artist() with a single DELETE. Returns the number of removed links.
+    """
+    pairs = list(pairs)
+    artist_ids, song_ids = _resolve_artist_song_pairs(pairs)
+    links = {(artist_ids[artist_name], song_ids[song_title]) for artist_name, song_title in pairs}
+
+    # OR-ing one condition per pair hits expression depth limits (SQLite: 1000), so the
+    # candidate rows are narrowed with two IN filters and matched by pk instead
+    ArtistSong = Artist.songs.through
+    candidates = ArtistSong.objects.filter(
+        artist_id__in=artist_ids.values(),
+        song_id__in=song_ids.values(),
+    ).values_list('pk', 'artist_id', 'song_id')
+    link_ids = [pk for pk, artist_id, song_id in candidates if (artist_id, song_id) in links]
+
+    if not link_ids:
+        return 0
+    return ArtistSong.objects.filter(pk__in=link_ids).delete()[0]
+
+
 def get_songs_by_artist(artist_name: str):
     # artist = Artist.objects.get(name=artist_name)
     # return artist.songs.all().order_by("-id")
@@ -200,16 +261,52 @@ def get_drivers_with_expired_licenses(due_date: date):
 
 # 05. Car Registration ----------------------------------------------------------------
 
+def register_cars_by_owners(owners: list) -> list:
+    """
+    Registers one free car with one free registration per owner, in a single transaction.
+    Rows locked by concurrent callers are skipped rather than waited on, so parallel workers
+    never hand out the same car or registration. When fewer cars or registrations are free than
+    owners, only the first owners get one. Returns one message per registration.
+    """
+    today = date.today()
+
+    with transaction.atomic():
+        registrations = list(
+            Registration.objects.select_for_update(skip_locked=True)
+            .filter(car__isnull=True)
+            .order_by('pk')[:len(owners)]
+        )
+        # of=('self',): Postgres cannot lock the nullable side of the LEFT JOIN to registration
+        cars = list(
+            Car.objects.select_for_update(skip_locked=True, of=('self',))
+            .filter(registration__isnull=True)
+            .order_by('pk')[:len(owners)]
+        )
+
+        allocations = list(zip(owners, cars, registrations))
+        for owner, car_object, car_registration in allocations:
+            car_object.owner = owner
+            car_registration.car = car_object
+            car_registration.registration_date = today
+
+        Car.objects.bulk_update([car_object for _, car_object, _ in allocations], ['owner'])
+        Registration.objects.bulk_update(
+            [car_registration for _, _, car_registration in allocations],
+            ['car', 'registration_date'],
+        )
+
+    return [
+        f"Successfully registered {car_object.model} to {owner.name}"
+        f" with registration number {car_registration.registration_number}."
+        for owner, car_object, car_registration in allocations
+    ]
+
+
 def register_car_by_owner(owner: Owner) -> str:
-    car_registration = Registration.objects.filter(car__isnull=True).first()
-    car_object = Car.objects.filter(registration__isnull=True).first()
-    car_registration.car = car_object
-    car_registration.registration_date = date.today()
-    car_registration.save()
-    car_object.owner = owner
-    car_object.save()
-    return (f"Successfully registered {car_object.model} to {owner.name}"
-            f" with registration number {car_registration.registration_number}.")
+    messages = register_cars_by_owners([owner])
+    if not messages:
+        raise ValueError(f"No free car and registration left to register to {owner.name}.")
+    return messages[0]
 
 
 # owner1 = Owner.objects.create(name='Ivelin Milchev')
@@ -223,8 +320,8 @@ def register_car_by_owner(owner: Owner) -> str:
 # registration2 = Registration.objects.create(registration_number='XYZ789')
 # print(register_car_by_owner(owner1))
 
-car = Car.objects.get(model='Honda Civic')
-if not car.owner:
-    print('No owner')
-else:
-    print(car.owner.name)
+# car = Car.objects.get(model='Honda Civic')
+# if not car.owner:
+#     print('No owner')
+# else:
+#     print(car.owner.name)
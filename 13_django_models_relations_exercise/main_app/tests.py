@@ -1,3 +1,59 @@
+from decimal import Decimal
+
 from django.test import TestCase
 
-# Create your tests here.
+from caller import register_car_by_owner, show_all_authors_with_their_books
+from main_app.models import Author, Book, Car, Owner, Registration
+
+
+class ShowAllAuthorsWithTheirBooksTests(TestCase):
+    def create_authors(self, count: int):
+        for number in range(count):
+            author = Author.objects.create(name=f'Author {number}')
+            Book.objects.bulk_create(
+                Book(title=f'Book {number}-{index}', price=Decimal('9.99'), author=author)
+                for index in range(number % 3 + 1)
+            )
+        Author.objects.create(name='Author without books')
+
+    def test_two_queries_regardless_of_the_number_of_authors(self):
+        for count in (3, 30):
+            with self.subTest(authors=count):
+                Author.objects.all().delete()
+                self.create_authors(count)
+
+                with self.assertNumQueries(2):
+                    result = show_all_authors_with_their_books()
+
+                self.assertEqual(len(result.split('\n')), count)
+
+    def test_authors_without_books_are_excluded(self):
+        self.create_authors(3)
+
+        result = show_all_authors_with_their_books()
+
+        self.assertNotIn('Author without books', result)
+        self.assertEqual(
+            result.split('\n')[1],
+            'Author 1 has written - Book 1-0, Book 1-1!',
+        )
+
+
+class RegisterCarByOwnerTests(TestCase):
+    def test_registers_a_free_car_with_a_free_registration(self):
+        owner = Owner.objects.create(name='Alice Smith')
+        Car.objects.create(model='Honda Civic', year=2021)
+        Registration.objects.create(registration_number='XYZ789')
+
+        self.assertEqual(
+            register_car_by_owner(owner),
+            'Successfully registered Honda Civic to Alice Smith with registration number XYZ789.',
+        )
+        self.assertEqual(Registration.objects.get().car.owner, owner)
+
+    def test_raises_when_nothing_is_free(self):
+        owner = Owner.objects.create(name='Alice Smith')
+        Car.objects.create(model='Honda Civic', year=2021)
+
+        with self.assertRaisesMessage(ValueError, 'No free car and registration left to register to Alice Smith.'):
+            register_car_by_owner(owner)
@@ -0,0 +1,89 @@
+import os
+import sys
+import time
+from itertools import cycle
+from multiprocessing import Pool
+
+import django
+
+# Set up Django
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "orm_skeleton.settings")
+django.setup()
+
+from django.db import connections
+from main_app.models import Car, Owner, Registration
+from caller import register_cars_by_owners
+
+# Every worker keeps registering until no free car or registration is left,
+# then the totals are checked for double allocations. Needs PostgreSQL: SQLite has no
+# row locks and fails concurrent writers with 'database is locked'.
+#   python stress_register_cars.py 8 2000 25
+# (workers, cars, cars per call)
+
+
+def seed(cars_count: int) -> list:
+    Car.objects.bulk_create(Car(model=f'Stress car {number}', year=2024) for number in range(cars_count))
+    Registration.objects.bulk_create(
+        Registration(registration_number=f'ST{number:07d}') for number in range(cars_count)
+    )
+    owners = Owner.objects.bulk_create(Owner(name=f'Stress owner {number}') for number in range(cars_count))
+    return [owner.pk for owner in owners]
+
+
+def clear():
+    Registration.objects.filter(registration_number__startswith='ST').delete()
+    Car.objects.filter(model__startswith='Stress car ').delete()
+    Owner.objects.filter(name__startswith='Stress owner ').delete()
+
+
+def worker(owner_ids: list, batch_size: int) -> int:
+    registered = 0
+    owners = list(Owner.objects.filter(pk__in=owner_ids).order_by('pk'))
+    # a worker stops only when it finds no free, unlocked row, so the last one to stop drains the table
+    for start in cycle(range(0, len(owners), batch_size)):
+        messages = register_cars_by_owners(owners[start:start + batch_size])
+        if not messages:
+            return registered
+        registered += len(messages)
+
+
+def snapshot() -> tuple:
+    linked_registrations = Registration.objects.filter(car__isnull=False).count()
+    # a lost update of the old allocator leaves a car with an owner but without a registration
+    orphaned_cars = Car.objects.filter(owner__isnull=False, registration__isnull=True).count()
+    return linked_registrations, orphaned_cars
+
+
+if __name__ == '__main__':
+    workers_count = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    cars_count = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    batch_size = int(sys.argv[3]) if len(sys.argv) > 3 else 25
+
+    clear()
+    linked_before, orphaned_before = snapshot()
+    owner_ids = seed(cars_count)
+    # children must not share the parent's database connection
+    connections.close_all()
+
+    # every worker asks for cars for all owners, so they compete for the same rows
+    started = time.perf_counter()
+    with Pool(workers_count) as pool:
+        results = pool.starmap(worker, [(owner_ids, batch_size)] * workers_count)
+    elapsed = time.perf_counter() - started
+
+    linked_after, orphaned_after = snapshot()
+    registered = sum(results)
+    print(f'{workers_count} workers registered {registered}/{cars_count} cars in {elapsed:.2f}s: {results}')
+
+    failures = []
+    if registered != cars_count:
+        failures.append(f'expected {cars_count} registrations, workers reported {registered}')
+    if linked_after - linked_before != registered:
+        failures.append(f'{linked_after - linked_before} registrations linked in the database')
+    if orphaned_after != orphaned_before:
+        failures.append(f'{orphaned_after - orphaned_before} cars got an owner without a registration')
+
+    clear()
+    if failures:
+        sys.exit('FAILED: ' + '; '.join(failures))
+    print('OK: no car or registration was allocated twice')
@@ -146,4 +146,8 @@ from main_app.models import Mage, Necromancer, UserProfile, Message, Student, Cr
 # try:
 #     special_reservation1.extend_reservation(5)
 # except ValidationError as e:
-#     print(e)
\ No newline at end of file
+#     print(e)
+#
+# # Rooms of the hotel that are free from 2023-01-03 until the check-out on 2023-01-08
+# free_rooms = Room.objects.filter(hotel=hotel).available_between(date(2023, 1, 3), date(2023, 1, 8))
+# print(', '.join(room.number for room in free_rooms))
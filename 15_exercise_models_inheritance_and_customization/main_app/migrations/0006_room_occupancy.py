@@ -0,0 +1,58 @@
+# Generated by Django 5.0.4 on 2026-10-18 14:04
+
+import django.contrib.postgres.constraints
+import django.contrib.postgres.fields.ranges
+import django.db.models.deletion
+from django.contrib.postgres.operations import BtreeGistExtension
+from django.db import migrations, models
+from django.db.backends.postgresql.psycopg_any import DateRange
+
+
+def fill_room_occupancy(apps, schema_editor):
+    occupancy_model = apps.get_model('main_app', 'RoomOccupancy')
+
+    for reservation_model_name, occupancy_field in [
+        ('RegularReservation', 'regular_reservation'),
+        ('SpecialReservation', 'special_reservation'),
+    ]:
+        reservations = apps.get_model('main_app', reservation_model_name).objects.all()
+        occupancy_model.objects.bulk_create(
+            (
+                occupancy_model(
+                    room_id=reservation.room_id,
+                    period=DateRange(reservation.start_date, reservation.end_date),
+                    **{occupancy_field: reservation},
+                )
+                for reservation in reservations.iterator()
+            ),
+            batch_size=5000,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main_app', '0005_hotel_room_regularreservation_specialreservation'),
+    ]
+
+    operations = [
+        # GiST support for the = operator on room_id in the exclusion constraint
+        BtreeGistExtension(),
+        migrations.CreateModel(
+            name='RoomOccupancy',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period', django.contrib.postgres.fields.ranges.DateRangeField()),
+                ('regular_reservation', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='occupancy', to='main_app.regularreservation')),
+                ('room', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='occupancies', to='main_app.room')),
+                ('special_reservation', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='occupancy', to='main_app.specialreservation')),
+            ],
+        ),
+        # Filled before the constraint is added, so existing overlapping regular and special
+        # reservations of a room make the migration fail instead of being dropped silently
+        migrations.RunPython(fill_room_occupancy, reverse_code=migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='roomoccupancy',
+            constraint=django.contrib.postgres.constraints.ExclusionConstraint(expressions=[('room', '='), ('period', '&&')], name='room_occupancy_no_overlap'),
+        ),
+    ]
@@ -1,8 +1,11 @@
+from django.contrib.postgres.constraints import ExclusionConstraint
+from django.contrib.postgres.fields import DateRangeField, RangeOperators
 from django.core.exceptions import ValidationError
-from django.db import models
-from datetime import datetime, timedelta
+from django.db import IntegrityError, models, transaction
+from datetime import date, datetime, timedelta
 
-from django.db.models import Q
+from django.db.models import Exists, OuterRef, Q
+from django.db.backends.postgresql.psycopg_any import DateRange
 
 
 # 01. Character Classes ----------------------------------------------------------------
@@ -150,6 +153,16 @@ class Hotel(models.Model):
     address = models.CharField(max_length=200)
 
 
+class RoomQuerySet(models.QuerySet):
+    def available_between(self, start_date: date, end_date: date):
+        """
+        Rooms with no reservation of any kind overlapping [start_date, end_date), in one query.
+        Chains with other filters, e.g. Room.objects.filter(hotel=hotel).available_between(...).
+        """
+        booked = RoomOccupancy.objects.filter(room=OuterRef('pk'), period__overlap=DateRange(start_date, end_date))
+        return self.exclude(Exists(booked))
+
+
 class Room(models.Model):
     hotel = models.ForeignKey('Hotel', on_delete=models.CASCADE)
     number = models.CharField(max_length=100, unique=True)
@@ -157,6 +170,8 @@ class Room(models.Model):
     total_guests = models.PositiveIntegerField()
     price_per_night = models.DecimalField(max_digits=10, decimal_places=2)
 
+    objects = RoomQuerySet.as_manager()
+
     def clean(self) -> None:
         if self.total_guests > self.capacity:
             raise ValidationError("Total guests are more than the capacity of the room")
@@ -167,11 +182,46 @@ class Room(models.Model):
         return f"Room {self.number} created successfully"
 
 
+ROOM_OCCUPANCY_NO_OVERLAP = 'room_occupancy_no_overlap'
+
+
+class RoomOccupancy(models.Model):
+    # One row per regular or special reservation, so a single exclusion constraint
+    # rejects overlapping bookings of a room across both reservation tables
+    room = models.ForeignKey('Room', on_delete=models.CASCADE, related_name='occupancies')
+    period = DateRangeField()
+    regular_reservation = models.OneToOneField(
+        'RegularReservation',
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='occupancy',
+    )
+    special_reservation = models.OneToOneField(
+        'SpecialReservation',
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='occupancy',
+    )
+
+    class Meta:
+        constraints = [
+            ExclusionConstraint(
+                name=ROOM_OCCUPANCY_NO_OVERLAP,
+                expressions=[('room', RangeOperators.EQUAL), ('period', RangeOperators.OVERLAPS)],
+            ),
+        ]
+
+
 class BaseReservation(models.Model):
     room = models.ForeignKey('Room', on_delete=models.CASCADE)
     start_date = models.DateField()
     end_date = models.DateField()
 
+    # RoomOccupancy field pointing at this kind of reservation
+    occupancy_field = None
+
     class Meta:
         abstract = True
 
@@ -183,13 +233,16 @@ class BaseReservation(models.Model):
         total_cost = self.room.price_per_night * self.reservation_period()
         return round(total_cost, 2)
 
+    @property
+    def period(self) -> DateRange:
+        # half-open: the end date is the check-out day, free for the next guest
+        return DateRange(self.start_date, self.end_date)
+
     @property
     def is_available(self):
-        reservation = self.__class__.objects.filter(
-            room=self.room,
-            end_date__gte=self.start_date,
-            start_date__lte=self.end_date
-        )
+        reservation = RoomOccupancy.objects.filter(room=self.room, period__overlap=self.period)
+        if self.pk is not None:
+            reservation = reservation.exclude(**{self.occupancy_field: self.pk})
         return not reservation.exists()
 
     def clean(self):
@@ -200,8 +253,30 @@ class BaseReservation(models.Model):
         if not self.is_available:
             raise ValidationError(f"Room {self.room.number} cannot be reserved")
 
+    def save(self, *args, **kwargs):
+        # is_available is only a friendly early check, the exclusion constraint settles concurrent bookings
+        adding = self._state.adding
+        try:
+            with transaction.atomic():
+                super().save(*args, **kwargs)
+                RoomOccupancy.objects.update_or_create(
+                    **{self.occupancy_field: self},
+                    defaults={'room': self.room, 'period': self.period},
+                )
+        except IntegrityError as error:
+            if adding:
+                # the INSERT was rolled back with the occupancy row
+                self.pk = None
+                self._state.adding = True
+            # only an overlap is a booking conflict; FK and NOT NULL failures are left as they are
+            diag = getattr(error.__cause__, 'diag', None)
+            if getattr(diag, 'constraint_name', None) != ROOM_OCCUPANCY_NO_OVERLAP:
+                raise
+            raise ValidationError(f"Room {self.room.number} cannot be reserved")
+
 
 class RegularReservation(BaseReservation):
+    occupancy_field = 'regular_reservation'
 
     def save(self, *args, **kwargs):
         super().clean()
@@ -210,6 +285,7 @@ class RegularReservation(BaseReservation):
 
 
 class SpecialReservation(BaseReservation):
+    occupancy_field = 'special_reservation'
 
     def save(self, *args, **kwargs):
         super().clean()
@@ -217,18 +293,15 @@ class SpecialReservation(BaseReservation):
         return f"Special reservation for room {self.room.number}"
 
     def extend_reservation(self, days: int):
-        new_end_date = self.end_date + timedelta(days=days)
+        previous_end_date = self.end_date
+        self.end_date = self.end_date + timedelta(days=days)
 
-        if SpecialReservation.objects.filter(
-            room=self.room,
-            end_date__gte=self.end_date,
-            start_date__lte=new_end_date
-        ).exists():
+        try:
+            self.save()
+        except ValidationError:
+            self.end_date = previous_end_date
             raise ValidationError(
                 "Error during extending reservation"
             )
 
-        self.end_date = new_end_date
-        self.save()
         return f"Extended reservation for room {self.room.number} with {days} days"
-
@@ -0,0 +1,64 @@
+import os
+import random
+import sys
+import time
+
+import django
+
+# Set up Django
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "orm_skeleton.settings")
+django.setup()
+
+from django.db import transaction
+
+from main_app.models import Document
+
+#   python benchmark_document_search.py seed 5000000
+#   python benchmark_document_search.py run
+
+BATCH_SIZE = 10_000
+REPEATS = 20
+WORDS = [
+    'django', 'python', 'database', 'index', 'query', 'template', 'migration', 'model', 'view', 'cache',
+    'postgres', 'search', 'vector', 'rank', 'form', 'admin', 'signal', 'middleware', 'session', 'router',
+]
+QUERIES = ['kubernetes', 'django "web framework"', 'postgres search -cache', 'zzznomatch']
+
+
+def seed_documents(total: int):
+    rng = random.Random(0)
+    existing = Document.objects.count()
+
+    for start in range(existing, total, BATCH_SIZE):
+        with transaction.atomic():
+            Document.objects.bulk_create(
+                Document(
+                    title=f'Document {number} about {rng.choice(WORDS)}',
+                    content=' '.join(rng.choices(WORDS, k=60))
+                    + (' kubernetes' if number % 10_000 == 0 else '')
+                    + (' django web framework' if number % 1000 == 0 else ''),
+                )
+                for number in range(start, min(start + BATCH_SIZE, total))
+            )
+
+
+def measure(query: str):
+    started = time.perf_counter()
+    for _ in range(REPEATS):
+        results = list(Document.objects.search(query))
+    elapsed = (time.perf_counter() - started) / REPEATS
+    print(f'{query!r:>26}: {len(results)} results, {elapsed * 1000:.1f} ms')
+
+
+if __name__ == '__main__':
+    mode = sys.argv[1] if len(sys.argv) > 1 else 'run'
+
+    if mode == 'seed':
+        seed_documents(int(sys.argv[2]) if len(sys.argv) > 2 else 5_000_000)
+        print(f'Documents in table: {Document.objects.count()}')
+        sys.exit()
+
+    print(f'Documents in table: {Document.objects.count()}')
+    print(Document.objects.search(QUERIES[1]).explain(analyze=True))
+    for query in QUERIES:
+        measure(query)
@@ -107,7 +107,6 @@ from django.core.exceptions import ValidationError
 
 # 05 Vector Searching ----------------------------------------------------------------
 
-# from django.contrib.postgres.search import SearchVector
 # # Create the first 'Document' object with a title and content.
 # document1 = Document.objects.create(
 #     title="Django Framework 1",
@@ -120,13 +119,13 @@ from django.core.exceptions import ValidationError
 #     content="Django framework provides tools for creating web pages, handling URL routing, and more.",
 # )
 #
-# # Update the 'search_vector' field in the 'Document' model with search vectors.
-# Document.objects.update(search_vector=SearchVector('title', 'content'))
+# # The 'search_vector' field is filled by a database trigger; rows created before it
+# # are filled with: python manage.py backfill_search_vectors
 #
 # # Perform a full-text search for documents containing the words 'django' and 'web framework'.
-# results = Document.objects.filter(search_vector='django web framework')
+# results = Document.objects.search('django web framework')
 #
 # # Print the search results.
 # for result in results:
-#     print(f"Title: {result.title}")
+#     print(f"Title: {result.title} ({result.rank:.2f}) - {result.headline}")
 
@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import F, Max, Min
+
+from main_app.models import Document
+
+
+class Command(BaseCommand):
+    help = 'Fills Document.search_vector one pk range at a time.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=10_000)
+        parser.add_argument('--all', action='store_true', help='Recompute every row, not only empty vectors.')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        documents = Document.objects.all()
+        if not options['all']:
+            documents = documents.filter(search_vector__isnull=True)
+
+        bounds = documents.aggregate(low=Min('pk'), high=Max('pk'))
+        if bounds['low'] is None:
+            self.stdout.write(self.style.SUCCESS('Every document already has a search vector.'))
+            return
+
+        updated = 0
+        for start in range(bounds['low'], bounds['high'] + 1, batch_size):
+            # Rewriting the title fires the search_vector trigger, so the vector is built by the
+            # same SQL as on insert. One transaction per batch keeps row locks short.
+            with transaction.atomic():
+                updated += documents.filter(pk__gte=start, pk__lt=start + batch_size).update(title=F('title'))
+            self.stdout.write(f'pk {min(start + batch_size - 1, bounds["high"])}/{bounds["high"]}: {updated} documents')
+
+        self.stdout.write(self.style.SUCCESS(f'Filled search vectors for {updated} documents.'))
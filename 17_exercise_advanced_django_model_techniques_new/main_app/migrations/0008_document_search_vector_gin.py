@@ -0,0 +1,45 @@
+# Generated by Django 5.0.4 on 2026-10-18 14:02
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+# Title words weigh more than content words in SearchRank
+CREATE_TRIGGER = """
+CREATE FUNCTION main_app_document_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('english'::regconfig, COALESCE(NEW.title, '')), 'A')
+        || setweight(to_tsvector('english'::regconfig, COALESCE(NEW.content, '')), 'B');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER main_app_document_search_vector_update
+    BEFORE INSERT OR UPDATE OF title, content ON main_app_document
+    FOR EACH ROW EXECUTE FUNCTION main_app_document_search_vector_update();
+"""
+
+DROP_TRIGGER = """
+DROP TRIGGER IF EXISTS main_app_document_search_vector_update ON main_app_document;
+DROP FUNCTION IF EXISTS main_app_document_search_vector_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main_app', '0007_document'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='document',
+            name='main_app_do_search__c97410_idx',
+        ),
+        migrations.AddIndex(
+            model_name='document',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='document_search_vector_gin'),
+        ),
+        # Existing rows are filled by the backfill_search_vectors command, in batches
+        migrations.RunSQL(CREATE_TRIGGER, reverse_sql=DROP_TRIGGER),
+    ]
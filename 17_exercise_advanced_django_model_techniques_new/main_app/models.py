@@ -1,4 +1,5 @@
-from django.contrib.postgres.search import SearchVectorField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchHeadline, SearchQuery, SearchRank, SearchVectorField
 from django.core.validators import RegexValidator, MinValueValidator, MinLengthValidator
 from django.db import models
 from decimal import Decimal
@@ -185,12 +186,33 @@ class FlashHero(Hero):
 
 # 05 Vector Searching ----------------------------------------------------------------
 
+# Text search configuration of the search_vector trigger (migration 0008) and of search()
+SEARCH_CONFIG = 'english'
+
+
+class DocumentQuerySet(models.QuerySet):
+    def search(self, query: str, limit: int = 10):
+        """
+        Best ``limit`` matches for a web-search style query, e.g. 'django "web framework" -flask',
+        annotated with ``rank`` and a ``headline`` snippet of the content.
+        """
+        search_query = SearchQuery(query, config=SEARCH_CONFIG, search_type='websearch')
+        # ts_headline is costly enough that PostgreSQL only evaluates it for the rows left after the LIMIT
+        return self.filter(search_vector=search_query).annotate(
+            rank=SearchRank(models.F('search_vector'), search_query),
+            headline=SearchHeadline('content', search_query, config=SEARCH_CONFIG, max_words=35, min_words=15),
+        ).order_by('-rank', 'pk')[:limit]
+
+
 class Document(models.Model):
     title = models.CharField(max_length=200)
     content = models.TextField()
+    # Filled by a database trigger on insert and on title/content updates, see backfill_search_vectors
     search_vector = SearchVectorField(null=True)
 
+    objects = DocumentQuerySet.as_manager()
+
     class Meta:
         indexes = [
-            models.Index(fields=['search_vector'])
+            GinIndex(fields=['search_vector'], name='document_search_vector_gin'),
         ]
@@ -7,71 +7,77 @@ django.setup()
 
 # Import your models
 from main_app.models import Product, Category, Customer, Order, OrderProduct, product_quantity_ordered, \
-    ordered_products_per_customer, filter_products, give_discount
+    ordered_products_per_customer, filter_products, give_discount, rebuild_quantity_ordered
 
 
 # Create and run queries
 def add_records_to_database():
     # Categories
-    food_category = Category.objects.create(name='Food')
-    drinks_category = (Category.objects.create(name='Drinks'))
-
-    # Food
-    product1 = Product.objects.create(name='Pizza', description='Delicious pizza with toppings', price=10.99,
-                                      category=food_category, is_available=False)
-    product2 = Product.objects.create(name='Burger', description='Classic burger with cheese and fries', price=7.99,
-                                      category=food_category, is_available=False)
-    product3 = Product.objects.create(name='Apples', description='A bag of juicy red apples', price=3.99,
-                                      category=food_category, is_available=True)
-    product4 = Product.objects.create(name='Bread', description='A freshly baked loaf of bread', price=2.49,
-                                      category=food_category, is_available=True)
-    product5 = Product.objects.create(name='Pasta and Sauce Bundle',
-                                      description='Package containing pasta and a jar of pasta sauce', price=6.99,
-                                      category=food_category, is_available=False)
-    product6 = Product.objects.create(name='Tomatoes', description='A bundle of ripe, red tomatoes', price=2.99,
-                                      category=food_category, is_available=True)
-    product7 = Product.objects.create(name='Carton of Eggs', description='A carton containing a dozen fresh eggs',
-                                      price=3.49, category=food_category, is_available=True)
-    product8 = Product.objects.create(name='Cheddar Cheese', description='A block of aged cheddar cheese', price=7.99,
-                                      category=food_category, is_available=False)
-    product9 = Product.objects.create(name='Milk', description='A gallon of fresh cow milk', price=3.49,
-                                      category=food_category, is_available=True)
-
-    # Drinks
-    product10 = Product.objects.create(name='Coca Cola', description='Refreshing cola drink', price=1.99,
-                                       category=drinks_category, is_available=True)
-    product11 = Product.objects.create(name='Orange Juice', description='Freshly squeezed orange juice', price=2.49,
-                                       category=drinks_category, is_available=False)
-    product12 = Product.objects.create(name='Bottled Water', description='A 12-pack of purified bottled water',
-                                       price=4.99, category=drinks_category, is_available=True)
-    product13 = Product.objects.create(name='Orange Soda', description='A 6-pack of carbonated orange soda', price=5.49,
-                                       category=drinks_category, is_available=True)
-    product14 = Product.objects.create(name='Bottled Green Tea', description='A bottled green tea', price=3.99,
-                                       category=drinks_category, is_available=False)
-    product15 = Product.objects.create(name='Beer', description='A bottled craft beer', price=5.49,
-                                       category=drinks_category, is_available=True)
+    food_category, drinks_category = Category.objects.bulk_create([Category(name='Food'), Category(name='Drinks')])
+
+    products = Product.objects.bulk_create([
+        # Food
+        Product(name='Pizza', description='Delicious pizza with toppings', price=10.99,
+                category=food_category, is_available=False),
+        Product(name='Burger', description='Classic burger with cheese and fries', price=7.99,
+                category=food_category, is_available=False),
+        Product(name='Apples', description='A bag of juicy red apples', price=3.99,
+                category=food_category, is_available=True),
+        Product(name='Bread', description='A freshly baked loaf of bread', price=2.49,
+                category=food_category, is_available=True),
+        Product(name='Pasta and Sauce Bundle', description='Package containing pasta and a jar of pasta sauce',
+                price=6.99, category=food_category, is_available=False),
+        Product(name='Tomatoes', description='A bundle of ripe, red tomatoes', price=2.99,
+                category=food_category, is_available=True),
+        Product(name='Carton of Eggs', description='A carton containing a dozen fresh eggs',
+                price=3.49, category=food_category, is_available=True),
+        Product(name='Cheddar Cheese', description='A block of aged cheddar cheese', price=7.99,
+                category=food_category, is_available=False),
+        Product(name='Milk', description='A gallon of fresh cow milk', price=3.49,
+                category=food_category, is_available=True),
+
+        # Drinks
+        Product(name='Coca Cola', description='Refreshing cola drink', price=1.99,
+                category=drinks_category, is_available=True),
+        Product(name='Orange Juice', description='Freshly squeezed orange juice', price=2.49,
+                category=drinks_category, is_available=False),
+        Product(name='Bottled Water', description='A 12-pack of purified bottled water',
+                price=4.99, category=drinks_category, is_available=True),
+        Product(name='Orange Soda', description='A 6-pack of carbonated orange soda', price=5.49,
+                category=drinks_category, is_available=True),
+        Product(name='Bottled Green Tea', description='A bottled green tea', price=3.99,
+                category=drinks_category, is_available=False),
+        Product(name='Beer', description='A bottled craft beer', price=5.49,
+                category=drinks_category, is_available=True),
+    ])
+    product = {p.name: p for p in products}
 
     # Customers
-    customer1 = Customer.objects.create(username='john_doe')
-    customer2 = Customer.objects.create(username='alex_alex')
-    customer3 = Customer.objects.create(username='peter132')
-    customer4 = Customer.objects.create(username='k.k.')
-    customer5 = Customer.objects.create(username='peter_smith')
+    customer1, customer2, customer3, customer4, customer5 = Customer.objects.bulk_create([
+        Customer(username=username) for username in ('john_doe', 'alex_alex', 'peter132', 'k.k.', 'peter_smith')
+    ])
 
     # Orders
-    order1 = Order.objects.create(customer=customer1)
-    order_product1 = OrderProduct.objects.create(order=order1, product=product3, quantity=2)
-    order_product2 = OrderProduct.objects.create(order=order1, product=product6, quantity=1)
-    order_product3 = OrderProduct.objects.create(order=order1, product=product7, quantity=5)
-    order_product4 = OrderProduct.objects.create(order=order1, product=product13, quantity=1)
-
-    order2 = Order.objects.create(customer=customer3)
-    order_product5 = OrderProduct.objects.create(order=order2, product=product3, quantity=2)
-    order_product6 = OrderProduct.objects.create(order=order2, product=product9, quantity=1)
-
-    order3 = Order.objects.create(customer=customer1)
-    order_product5 = OrderProduct.objects.create(order=order3, product=product12, quantity=4)
-    order_product6 = OrderProduct.objects.create(order=order3, product=product7, quantity=3)
+    order1, order2, order3 = Order.objects.bulk_create([
+        Order(customer=customer1),
+        Order(customer=customer3),
+        Order(customer=customer1),
+    ])
+    OrderProduct.objects.bulk_create([
+        OrderProduct(order=order1, product=product['Apples'], quantity=2),
+        OrderProduct(order=order1, product=product['Tomatoes'], quantity=1),
+        OrderProduct(order=order1, product=product['Carton of Eggs'], quantity=5),
+        OrderProduct(order=order1, product=product['Orange Soda'], quantity=1),
+
+        OrderProduct(order=order2, product=product['Apples'], quantity=2),
+        OrderProduct(order=order2, product=product['Milk'], quantity=1),
+
+        OrderProduct(order=order3, product=product['Bottled Water'], quantity=4),
+        OrderProduct(order=order3, product=product['Carton of Eggs'], quantity=3),
+    ])
+
+    # bulk_create skips the signals that keep Product.quantity_ordered current
+    rebuild_quantity_ordered()
     return "All data entered!"
 
 
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from main_app.models import rebuild_quantity_ordered
+
+
+class Command(BaseCommand):
+    help = 'Recomputes Product.quantity_ordered from the OrderProduct rows.'
+
+    def handle(self, *args, **options):
+        updated = rebuild_quantity_ordered()
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt quantity_ordered for {updated} products.'))
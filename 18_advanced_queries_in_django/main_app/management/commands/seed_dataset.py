@@ -0,0 +1,34 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.core.management.color import no_style
+from django.db import connection
+
+from main_app.models import Category, Customer, Order, OrderProduct, Product
+from main_app.seeding import SCALES, seed
+
+
+class Command(BaseCommand):
+    help = (
+        'Fills the shop tables with a generated, reproducible dataset. Category names are unique, '
+        'so seeding again needs --clear.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scale', choices=SCALES, default='1k')
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--batch-size', type=int, default=10_000)
+        parser.add_argument('--clear', action='store_true', help='Empty the shop tables first.')
+
+    def handle(self, *args, **options):
+        if options['clear']:
+            # Flushing the tables skips the per-row OrderProduct signals that a delete() would send
+            tables = [model._meta.db_table for model in (OrderProduct, Order, Customer, Product, Category)]
+            connection.ops.execute_sql_flush(connection.ops.sql_flush(no_style(), tables))
+        elif Category.objects.filter(name='Category 0').exists():
+            raise CommandError('The tables already hold a seeded dataset; run again with --clear.')
+
+        started = time.perf_counter()
+        counts = seed(options['scale'], options['seed'], options['batch_size'])
+        summary = ', '.join(f'{count} {name}' for name, count in counts.items())
+        self.stdout.write(self.style.SUCCESS(f'Inserted {summary} in {time.perf_counter() - started:.1f}s.'))
@@ -0,0 +1,30 @@
+# Generated by Django 5.0.4 on 2024-07-03 09:10
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+
+def fill_quantity_ordered(apps, schema_editor):
+    product_model = apps.get_model('main_app', 'Product')
+    order_product_model = apps.get_model('main_app', 'OrderProduct')
+
+    totals = order_product_model.objects.filter(product=OuterRef('pk')).order_by().values('product').annotate(
+        total=Sum('quantity')).values('total')
+    product_model.objects.update(quantity_ordered=Coalesce(Subquery(totals), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='product',
+            name='quantity_ordered',
+            field=models.PositiveIntegerField(db_index=True, default=0),
+        ),
+        migrations.RunPython(fill_quantity_ordered, reverse_code=migrations.RunPython.noop),
+    ]
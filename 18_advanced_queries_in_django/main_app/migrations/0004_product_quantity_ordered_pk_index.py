@@ -0,0 +1,22 @@
+# Generated by Django 5.0.4 on 2026-10-18 14:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main_app', '0003_category_name_unique_product_available_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='product',
+            name='quantity_ordered',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['-quantity_ordered', 'id'], name='product_qty_ordered_pk'),
+        ),
+    ]
@@ -1,5 +1,10 @@
-from django.db import models
-from django.db.models import Sum, Q, F
+from decimal import Decimal
+
+from django.db import models, transaction
+from django.db.models import Sum, Q, F, Prefetch, OuterRef, Subquery, Min, Max
+from django.db.models.functions import Coalesce
+
+from main_app.query_budget import query_budget
 
 
 # 01. Available Products ----------------------------------------------------
@@ -10,11 +15,12 @@ class ProductManager(models.Manager):
         return self.filter(is_available=True)
 
     def available_products_in_category(self, category_name: str):
+        # resolves the unique Category.name and then reads product_available_cat_price in one query
         return self.filter(is_available=True, category__name=category_name)
 
 
 class Category(models.Model):
-    name = models.CharField(max_length=100)
+    name = models.CharField(max_length=100, unique=True)
 
 
 class Product(models.Model):
@@ -23,9 +29,23 @@ class Product(models.Model):
     price = models.DecimalField(max_digits=10, decimal_places=2)
     category = models.ForeignKey(Category, on_delete=models.CASCADE)
     is_available = models.BooleanField(default=True)
+    # Sum of OrderProduct.quantity, kept current by main_app.signals;
+    # repair drift with `python manage.py rebuild_quantity_ordered`
+    quantity_ordered = models.PositiveIntegerField(default=0)
 
     objects = ProductManager()
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['category', 'price'],
+                condition=Q(is_available=True),
+                name='product_available_cat_price',
+            ),
+            # serves product_quantity_ordered() in index order, ties broken by pk
+            models.Index(fields=['-quantity_ordered', 'id'], name='product_qty_ordered_pk'),
+        ]
+
     def __str__(self):
         return f"{self.category.name}: {self.name}"
 
@@ -57,20 +77,39 @@ class OrderProduct(models.Model):
 
 
 # Second variant
+# def product_quantity_ordered():
+#     qty_ordered = Product.objects.filter(order__isnull=False).annotate(
+#         quantity_ordered=Sum('orderproduct__quantity')).order_by('-quantity_ordered')
+#
+#     result = [f"Quantity ordered of {product.name}: {product.quantity_ordered}" for product in
+#               qty_ordered]
+#
+#     return '\n'.join(result)
+
+
+# Third variant - reads the maintained Product.quantity_ordered counter
 def product_quantity_ordered():
-    qty_ordered = Product.objects.filter(order__isnull=False).annotate(
-        quantity_ordered=Sum('orderproduct__quantity')).order_by('-quantity_ordered')
+    qty_ordered = Product.objects.filter(quantity_ordered__gt=0).order_by('-quantity_ordered', 'pk').values_list(
+        'name', 'quantity_ordered')
 
-    result = [f"Quantity ordered of {product.name}: {product.quantity_ordered}" for product in
-              qty_ordered]
+    result = [f"Quantity ordered of {name}: {quantity_ordered}" for name, quantity_ordered in qty_ordered]
 
     return '\n'.join(result)
 
 
+def rebuild_quantity_ordered() -> int:
+    totals = OrderProduct.objects.filter(product=OuterRef('pk')).order_by().values('product').annotate(
+        total=Sum('quantity')).values('total')
+    return Product.objects.update(quantity_ordered=Coalesce(Subquery(totals), 0))
+
+
 # 03. Ordered Products Per Customer -------------------------------------------------
 
+@query_budget(2)
 def ordered_products_per_customer():
-    ordered_products = Order.objects.prefetch_related('orderproduct_set__product__category').all().order_by('pk')
+    ordered_products = Order.objects.select_related('customer').prefetch_related(
+        Prefetch('orderproduct_set', queryset=OrderProduct.objects.select_related('product__category'))
+    ).order_by('pk')
     result = []
     for order in ordered_products:
         result.append(f'Order ID: {order.id}, Customer: {order.customer.username}')
@@ -88,7 +127,19 @@ def filter_products():
 # 05. Give Discounts ------------------------------------------------
 
 def give_discount():
-    Product.objects.filter(Q(is_available=True) & Q(price__gt=3.00)).update(price=F('price') * 0.7)
-    products = Product.objects.filter(is_available=True).order_by('-price', 'name')
-    result = [f'{product.name}: {product.price}lv.' for product in products]
-    return '\n'.join(result)
+    return '\n'.join(stream_give_discount())
+
+
+def stream_give_discount(chunk_size: int = 1000):
+    # Discounts available products over 3.00 one pk range at a time (short locks) before returning,
+    # then streams the report from a single ordered query instead of holding every row in memory.
+    to_discount = Product.objects.filter(is_available=True, price__gt=3.00)
+    bounds = to_discount.aggregate(low=Min('pk'), high=Max('pk'))
+
+    if bounds['low'] is not None:
+        for start in range(bounds['low'], bounds['high'] + 1, chunk_size):
+            with transaction.atomic():
+                to_discount.filter(pk__gte=start, pk__lt=start + chunk_size).update(price=F('price') * Decimal('0.7'))
+
+    products = Product.objects.filter(is_available=True).order_by('-price', 'name').values_list('name', 'price')
+    return (f'{name}: {price}lv.' for name, price in products.iterator(chunk_size=chunk_size))
@@ -0,0 +1,56 @@
+import logging
+from contextlib import ContextDecorator
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+class query_budget(ContextDecorator):
+    """
+    Counts the queries executed inside the block / decorated function and complains when
+    there are more than ``max_queries``: raises QueryBudgetExceeded when strict, logs a
+    warning otherwise. ``strict`` defaults to settings.QUERY_BUDGET_STRICT, falling back to DEBUG.
+
+        @query_budget(2)
+        def report(): ...
+
+        with query_budget(2):
+            report()
+    """
+
+    def __init__(self, max_queries: int, using: str = DEFAULT_DB_ALIAS, strict: bool = None):
+        self.max_queries = max_queries
+        self.using = using
+        self.strict = strict
+        self.executed = 0
+
+    def __enter__(self):
+        # the decorator reuses this instance, so every call starts counting from zero
+        self.executed = 0
+        self._wrapper = connections[self.using].execute_wrapper(self._count)
+        self._wrapper.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._wrapper.__exit__(exc_type, exc_value, traceback)
+        if exc_type is not None or self.executed <= self.max_queries:
+            return False
+
+        message = f'Executed {self.executed} queries, the budget is {self.max_queries}.'
+        strict = self.strict
+        if strict is None:
+            strict = getattr(settings, 'QUERY_BUDGET_STRICT', settings.DEBUG)
+        if strict:
+            raise QueryBudgetExceeded(message)
+        logger.warning(message)
+        return False
+
+    def _count(self, execute, sql, params, many, context):
+        self.executed += 1
+        return execute(sql, params, many, context)
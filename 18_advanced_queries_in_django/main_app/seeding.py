@@ -0,0 +1,91 @@
+import random
+from array import array
+from decimal import Decimal
+from itertools import islice
+
+from django.db import transaction
+
+from main_app.models import Category, Customer, Order, OrderProduct, Product, rebuild_quantity_ordered
+
+# Number of order lines (the largest table) per scale; the other tables are derived from it
+SCALES = {
+    '1k': 1_000,
+    '100k': 100_000,
+    '10m': 10_000_000,
+}
+
+PRODUCT_WORDS = ('Pizza', 'Burger', 'Apples', 'Bread', 'Pasta', 'Tomatoes', 'Eggs', 'Cheese', 'Milk', 'Cola',
+                 'Juice', 'Water', 'Soda', 'Tea', 'Beer')
+
+
+def _categories(count: int):
+    for index in range(count):
+        yield Category(name=f'Category {index}')
+
+
+def _products(rng: random.Random, count: int, category_ids: array):
+    for index in range(count):
+        yield Product(
+            name=f'{PRODUCT_WORDS[index % len(PRODUCT_WORDS)]} {index}',
+            description=f'Generated product {index}' if rng.random() < 0.7 else None,
+            price=Decimal(rng.randrange(50, 5000)) / 100,
+            category_id=category_ids[rng.randrange(len(category_ids))],
+            is_available=rng.random() < 0.6,
+        )
+
+
+def _customers(count: int):
+    for index in range(count):
+        yield Customer(username=f'customer_{index}')
+
+
+def _orders(rng: random.Random, count: int, customer_ids: array):
+    for _ in range(count):
+        yield Order(customer_id=customer_ids[rng.randrange(len(customer_ids))])
+
+
+def _order_products(rng: random.Random, count: int, order_ids: array, product_ids: array):
+    for index in range(count):
+        yield OrderProduct(
+            # every order gets at least one line before lines are spread randomly
+            order_id=order_ids[index] if index < len(order_ids) else order_ids[rng.randrange(len(order_ids))],
+            product_id=product_ids[rng.randrange(len(product_ids))],
+            quantity=rng.randint(1, 10),
+        )
+
+
+def _insert(model, objects, batch_size: int) -> array:
+    # Returns the new primary keys in insertion order; an array keeps 10M ids at 8 bytes each
+    ids = array('q')
+    while True:
+        batch = list(islice(objects, batch_size))
+        if not batch:
+            return ids
+        with transaction.atomic():
+            ids.extend(obj.pk for obj in model.objects.bulk_create(batch))
+
+
+def seed(scale: str = '1k', seed_value: int = 0, batch_size: int = 10_000) -> dict:
+    """
+    Generates a deterministic Category/Product/Customer/Order/OrderProduct dataset: the same scale
+    and seed always produce the same rows. Returns the number of rows inserted per model.
+    """
+    lines_count = SCALES[scale]
+    rng = random.Random(seed_value)
+
+    category_ids = _insert(Category, _categories(max(lines_count // 10_000, 5)), batch_size)
+    product_ids = _insert(Product, _products(rng, max(lines_count // 10, 1), category_ids), batch_size)
+    customer_ids = _insert(Customer, _customers(max(lines_count // 20, 1)), batch_size)
+    order_ids = _insert(Order, _orders(rng, max(lines_count // 4, 1), customer_ids), batch_size)
+    line_ids = _insert(OrderProduct, _order_products(rng, lines_count, order_ids, product_ids), batch_size)
+
+    # bulk_create bypasses the signals that maintain Product.quantity_ordered
+    rebuild_quantity_ordered()
+
+    return {
+        'categories': len(category_ids),
+        'products': len(product_ids),
+        'customers': len(customer_ids),
+        'orders': len(order_ids),
+        'order products': len(line_ids),
+    }
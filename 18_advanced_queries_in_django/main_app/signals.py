@@ -0,0 +1,39 @@
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from main_app.models import OrderProduct, Product
+
+
+# 02. Product Quantity Ordered----------------------------------------------------
+# Keeps Product.quantity_ordered in step with OrderProduct rows. Queryset update()/delete(),
+# bulk_create() and M2M add() skip these signals - run rebuild_quantity_ordered after them.
+
+def _add_quantity(product_id: int, quantity: int):
+    # Clamped at 0: a counter that drifted low must not block deleting the lines it never counted
+    if quantity:
+        Product.objects.filter(pk=product_id).update(
+            quantity_ordered=Greatest(F('quantity_ordered') + quantity, 0))
+
+
+@receiver(pre_save, sender=OrderProduct)
+def remember_previous_quantity(sender, instance: OrderProduct, **kwargs):
+    instance._previous = None
+    if instance.pk is not None:
+        instance._previous = OrderProduct.objects.filter(pk=instance.pk).values_list(
+            'product_id', 'quantity').first()
+
+
+@receiver(post_save, sender=OrderProduct)
+def update_quantity_ordered_on_save(sender, instance: OrderProduct, **kwargs):
+    previous = getattr(instance, '_previous', None)
+    if previous is not None:
+        previous_product_id, previous_quantity = previous
+        _add_quantity(previous_product_id, -previous_quantity)
+    _add_quantity(instance.product_id, instance.quantity)
+
+
+@receiver(post_delete, sender=OrderProduct)
+def update_quantity_ordered_on_delete(sender, instance: OrderProduct, **kwargs):
+    _add_quantity(instance.product_id, -instance.quantity)
@@ -0,0 +1,205 @@
+from decimal import Decimal
+
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+
+from main_app.models import (Category, Customer, Order, OrderProduct, Product, give_discount,
+                             ordered_products_per_customer, product_quantity_ordered, stream_give_discount)
+from main_app.query_budget import QueryBudgetExceeded, query_budget
+
+
+class AvailableProductsInCategoryTests(TestCase):
+    CATEGORIES = 200
+
+    @classmethod
+    def setUpTestData(cls):
+        categories = Category.objects.bulk_create(
+            Category(name=f'Category {number}') for number in range(cls.CATEGORIES)
+        )
+        Product.objects.bulk_create(
+            Product(
+                name=f'Product {number}',
+                price=Decimal(number % 500) + Decimal('0.99'),
+                category=categories[number % len(categories)],
+                is_available=number % 3 != 0,
+            )
+            for number in range(20_000)
+        )
+
+    def test_plan_uses_partial_category_price_index(self):
+        # one category holds 0.5% of the products; with fresh statistics the planner picks the index
+        with connection.cursor() as cursor:
+            for model in (Category, Product):
+                cursor.execute(f'ANALYZE {connection.ops.quote_name(model._meta.db_table)}')
+
+        plan = Product.objects.available_products_in_category('Category 3').order_by('price').explain()
+
+        self.assertIn('product_available_cat_price', plan)
+
+    def test_returns_only_available_products_of_the_category(self):
+        products = Product.objects.available_products_in_category('Category 3')
+
+        self.assertEqual(
+            products.count(),
+            sum(1 for number in range(3, 20_000, self.CATEGORIES) if number % 3 != 0),
+        )
+        self.assertFalse(products.exclude(is_available=True).exists())
+        self.assertFalse(products.exclude(category__name='Category 3').exists())
+
+    def test_follows_a_rename_made_without_signals(self):
+        self.assertFalse(Product.objects.available_products_in_category('Renamed').exists())
+
+        Category.objects.filter(name='Category 3').update(name='Renamed')
+
+        self.assertTrue(Product.objects.available_products_in_category('Renamed').exists())
+        self.assertFalse(Product.objects.available_products_in_category('Category 3').exists())
+
+
+@override_settings(QUERY_BUDGET_STRICT=True)
+class OrderedProductsPerCustomerBudgetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        category = Category.objects.create(name='Food')
+        products = Product.objects.bulk_create(
+            Product(name=f'Product {number}', price=Decimal('1.99'), category=category) for number in range(5)
+        )
+        customers = Customer.objects.bulk_create(Customer(username=f'customer_{number}') for number in range(4))
+        orders = Order.objects.bulk_create(Order(customer=customer) for customer in customers * 3)
+        OrderProduct.objects.bulk_create(
+            OrderProduct(order=order, product=product, quantity=1) for order in orders for product in products
+        )
+
+    def test_report_stays_within_its_budget(self):
+        with self.assertNumQueries(2):
+            report = ordered_products_per_customer()
+
+        self.assertEqual(report.count('Order ID:'), 12)
+        self.assertEqual(report.count('- Product:'), 60)
+
+    def test_decorated_calls_count_from_zero(self):
+        for _ in range(3):
+            ordered_products_per_customer()
+
+    def test_exceeding_the_budget_raises(self):
+        with self.assertRaisesMessage(QueryBudgetExceeded, 'Executed 2 queries, the budget is 1.'):
+            with query_budget(1):
+                list(Customer.objects.all())
+                list(Order.objects.all())
+
+    def test_exceeding_the_budget_warns_when_not_strict(self):
+        with self.assertLogs('main_app.query_budget', 'WARNING'):
+            with query_budget(0, strict=False):
+                list(Customer.objects.all())
+
+
+class QuantityOrderedTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        category = Category.objects.create(name='Food')
+        cls.apples, cls.bread, cls.water = Product.objects.bulk_create(
+            Product(name=name, price=Decimal('1.99'), category=category) for name in ('Apples', 'Bread', 'Water')
+        )
+        cls.order = Order.objects.create(customer=Customer.objects.create(username='customer'))
+
+    def assertQuantities(self, apples, bread):
+        self.apples.refresh_from_db()
+        self.bread.refresh_from_db()
+        self.assertEqual((self.apples.quantity_ordered, self.bread.quantity_ordered), (apples, bread))
+
+    def test_create_adds_the_quantity(self):
+        OrderProduct.objects.create(order=self.order, product=self.apples, quantity=3)
+        OrderProduct.objects.create(order=self.order, product=self.apples, quantity=2)
+
+        self.assertQuantities(5, 0)
+
+    def test_quantity_change_applies_the_difference(self):
+        line = OrderProduct.objects.create(order=self.order, product=self.apples, quantity=3)
+
+        line.quantity = 7
+        line.save()
+
+        self.assertQuantities(7, 0)
+
+    def test_product_change_moves_the_quantity(self):
+        line = OrderProduct.objects.create(order=self.order, product=self.apples, quantity=3)
+
+        line.product = self.bread
+        line.save()
+
+        self.assertQuantities(0, 3)
+
+    def test_delete_subtracts_the_quantity(self):
+        line = OrderProduct.objects.create(order=self.order, product=self.apples, quantity=3)
+        OrderProduct.objects.create(order=self.order, product=self.apples, quantity=2)
+
+        line.delete()
+
+        self.assertQuantities(2, 0)
+
+    def test_bulk_create_is_counted_after_rebuild(self):
+        OrderProduct.objects.bulk_create([
+            OrderProduct(order=self.order, product=self.apples, quantity=3),
+            OrderProduct(order=self.order, product=self.bread, quantity=4),
+        ])
+        self.assertQuantities(0, 0)
+
+        out = StringIO()
+        call_command('rebuild_quantity_ordered', stdout=out)
+
+        self.assertQuantities(3, 4)
+        self.assertIn('Rebuilt quantity_ordered for 3 products.', out.getvalue())
+
+    def test_deleting_uncounted_lines_clamps_at_zero(self):
+        OrderProduct.objects.bulk_create([OrderProduct(order=self.order, product=self.apples, quantity=3)])
+        OrderProduct.objects.create(order=self.order, product=self.bread, quantity=2)
+
+        self.order.delete()
+
+        self.assertQuantities(0, 0)
+
+    def test_report_breaks_ties_by_pk(self):
+        OrderProduct.objects.create(order=self.order, product=self.water, quantity=2)
+        OrderProduct.objects.create(order=self.order, product=self.apples, quantity=2)
+        OrderProduct.objects.create(order=self.order, product=self.bread, quantity=5)
+
+        self.assertEqual(
+            product_quantity_ordered(),
+            'Quantity ordered of Bread: 5\n'
+            'Quantity ordered of Apples: 2\n'
+            'Quantity ordered of Water: 2',
+        )
+
+
+class GiveDiscountTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        category = Category.objects.create(name='Food')
+        Product.objects.bulk_create([
+            Product(name='Pizza', price=Decimal('10.99'), category=category, is_available=False),
+            Product(name='Apples', price=Decimal('3.99'), category=category),
+            Product(name='Bread', price=Decimal('2.49'), category=category),
+            Product(name='Cheese', price=Decimal('7.99'), category=category),
+            Product(name='Milk', price=Decimal('3.49'), category=category),
+            Product(name='Eggs', price=Decimal('2.49'), category=category),
+        ])
+
+    def test_discounts_before_the_report_is_read(self):
+        report = stream_give_discount(chunk_size=2)
+
+        self.assertEqual(Product.objects.get(name='Cheese').price, Decimal('5.59'))
+        self.assertEqual(Product.objects.get(name='Pizza').price, Decimal('10.99'))
+        self.assertEqual(Product.objects.get(name='Bread').price, Decimal('2.49'))
+        self.assertEqual(next(report), 'Cheese: 5.59lv.')
+
+    def test_report_is_ordered_by_price_then_name(self):
+        self.assertEqual(
+            give_discount(),
+            'Cheese: 5.59lv.\n'
+            'Apples: 2.79lv.\n'
+            'Bread: 2.49lv.\n'
+            'Eggs: 2.49lv.\n'
+            'Milk: 2.44lv.',
+        )
@@ -0,0 +1,78 @@
+import os
+import random
+import sys
+import time
+from datetime import date
+
+import django
+
+# Set up Django
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "orm_skeleton.settings")
+django.setup()
+
+from django.db import transaction
+from django.db.models import Q
+
+from main_app.models import Task
+
+#   python benchmark_task_search.py seed 10000000
+#   python benchmark_task_search.py run
+
+BATCH_SIZE = 10_000
+REPEATS = 5
+WORDS = ['report', 'invoice', 'meeting', 'deploy', 'review', 'backup', 'migration', 'budget', 'release', 'audit']
+QUERIES = ['quarterly', 'deploy', 'Task 4242', 'zzz-no-match']
+
+
+def seed_tasks(total: int):
+    rng = random.Random(0)
+    today = date.today()
+    existing = Task.objects.count()
+
+    for start in range(existing, total, BATCH_SIZE):
+        with transaction.atomic():
+            Task.objects.bulk_create(
+                Task(
+                    title=f'Task {number}',
+                    description=' '.join(rng.choices(WORDS, k=8)) + (' quarterly' if number % 1000 == 0 else ''),
+                    priority=('Low', 'Medium', 'High')[number % 3],
+                    creation_date=today,
+                    completion_date=today,
+                )
+                for number in range(start, min(start + BATCH_SIZE, total))
+            )
+
+
+def icontains_search(query: str):
+    # search_tasks before the search indexes
+    return Task.objects.filter(Q(title__icontains=query) | Q(description__icontains=query))
+
+
+def measure(name: str, search, query: str):
+    started = time.perf_counter()
+    for _ in range(REPEATS):
+        first_page = list(search(query)[:20])
+    page_elapsed = (time.perf_counter() - started) / REPEATS
+
+    started = time.perf_counter()
+    matches = search(query).count()
+    count_elapsed = time.perf_counter() - started
+
+    print(
+        f'{name:>9} {query!r:>16}: page 1 ({len(first_page)} rows) {page_elapsed * 1000:.1f} ms, '
+        f'count ({matches} rows) {count_elapsed * 1000:.1f} ms'
+    )
+
+
+if __name__ == '__main__':
+    mode = sys.argv[1] if len(sys.argv) > 1 else 'run'
+
+    if mode == 'seed':
+        seed_tasks(int(sys.argv[2]) if len(sys.argv) > 2 else 10_000_000)
+        print(f'Tasks in table: {Task.objects.count()}')
+        sys.exit()
+
+    print(f'Tasks in table: {Task.objects.count()}')
+    for query in QUERIES:
+        measure('icontains', icontains_search, query)
+        measure('indexed', Task.search_tasks, query)
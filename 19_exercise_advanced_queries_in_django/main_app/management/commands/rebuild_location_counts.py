@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from main_app.models import RealEstateListing
+
+
+class Command(BaseCommand):
+    help = 'Recomputes the LocationCount table from the RealEstateListing rows.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check', action='store_true',
+            help='Only compare LocationCount with the live counts and fail on differences.',
+        )
+
+    def handle(self, *args, **options):
+        if options['check']:
+            mismatches = RealEstateListing.objects.location_count_mismatches()
+            for location, (stored, live) in sorted(mismatches.items()):
+                self.stdout.write(f'{location}: stored {stored}, live {live}')
+            if mismatches:
+                raise CommandError(f'{len(mismatches)} locations are out of date.')
+            self.stdout.write(self.style.SUCCESS('LocationCount matches the listings.'))
+            return
+
+        rebuilt = RealEstateListing.objects.rebuild_location_counts()
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt counts for {rebuilt} locations.'))
@@ -1,7 +1,9 @@
 from decimal import Decimal
 
-from django.db import models
-from django.db.models import Q, Count, QuerySet, Avg
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models import Q, Count, QuerySet, Avg, F, Window
+from django.db.models.functions import RowNumber
 
 
 # 01. Real Estate Listing ----------------------------------------------------------------
@@ -18,10 +20,44 @@ class RealEstateListingManager(models.Manager):
     def with_bedrooms(self, bedrooms_count: int) -> QuerySet:
         return self.filter(bedrooms=bedrooms_count)
 
-    def popular_locations(self) -> QuerySet:
-        return self.values('location').annotate(
+    def popular_locations(self, limit: int = 2) -> QuerySet:
+        # Reads the top rows of the LocationCount table kept up to date by main_app.signals
+        from main_app.models import LocationCount
+
+        return LocationCount.objects.filter(listing_count__gt=0).order_by('-listing_count', 'location').values(
+            'location', location_count=F('listing_count')
+        )[:limit]
+
+    def live_location_counts(self) -> dict:
+        return dict(self.order_by().values('location').annotate(
             location_count=Count('location')
-        ).order_by('-location_count', 'location')[:2]
+        ).values_list('location', 'location_count'))
+
+    def location_count_mismatches(self) -> dict:
+        """
+        Compares LocationCount with the live GROUP BY. Returns {location: (stored, live)}
+        for every location where they differ.
+        """
+        from main_app.models import LocationCount
+
+        live = self.live_location_counts()
+        stored = dict(LocationCount.objects.filter(listing_count__gt=0).values_list('location', 'listing_count'))
+        return {
+            location: (stored.get(location, 0), live.get(location, 0))
+            for location in live.keys() | stored.keys()
+            if stored.get(location, 0) != live.get(location, 0)
+        }
+
+    def rebuild_location_counts(self) -> int:
+        from main_app.models import LocationCount
+
+        with transaction.atomic():
+            LocationCount.objects.all().delete()
+            created = LocationCount.objects.bulk_create(
+                LocationCount(location=location, listing_count=listing_count)
+                for location, listing_count in self.live_location_counts().items()
+            )
+        return len(created)
 
 
 # 02. Video Games Library ----------------------------------------------------------------
@@ -42,4 +78,50 @@ class VideoGameManager(models.Manager):
         avg_rating = self.aggregate(average=Avg('rating'))['average']
         return f'{avg_rating:.1f}'
 
+    STATS_CACHE_KEY = 'video_game_stats'
+    STATS_CACHE_TIMEOUT = 30
+
+    def stats(self) -> dict:
+        """
+        Highest and lowest rated game plus the min/max/average rating in one query,
+        cached for STATS_CACHE_TIMEOUT seconds. main_app.signals drops the cache on VideoGame writes.
+        """
+        stats = cache.get(self.STATS_CACHE_KEY)
+        if stats is None:
+            stats = self._compute_stats()
+            cache.set(self.STATS_CACHE_KEY, stats, self.STATS_CACHE_TIMEOUT)
+        return stats
+
+    @classmethod
+    def clear_stats_cache(cls):
+        cache.delete(cls.STATS_CACHE_KEY)
+
+    def _compute_stats(self) -> dict:
+        # The window average is repeated on every row, and filtering on the two row numbers
+        # keeps only the highest and lowest rated games
+        games = list(self.annotate(
+            avg_rating=Window(Avg('rating')),
+            highest_position=Window(RowNumber(), order_by=[F('rating').desc(), F('pk').asc()]),
+            lowest_position=Window(RowNumber(), order_by=[F('rating').asc(), F('pk').asc()]),
+        ).filter(Q(highest_position=1) | Q(lowest_position=1)))
+
+        if not games:
+            return {
+                'highest_rated_game': None,
+                'lowest_rated_game': None,
+                'max_rating': None,
+                'min_rating': None,
+                'average_rating': None,
+            }
+
+        highest_rated_game = next(game for game in games if game.highest_position == 1)
+        lowest_rated_game = next(game for game in games if game.lowest_position == 1)
+        return {
+            'highest_rated_game': highest_rated_game,
+            'lowest_rated_game': lowest_rated_game,
+            'max_rating': highest_rated_game.rating,
+            'min_rating': lowest_rated_game.rating,
+            'average_rating': f'{games[0].avg_rating:.1f}',
+        }
+
 # 03. Shopaholic Haven ----------------------------------------------------------------
@@ -0,0 +1,45 @@
+# Generated by Django 5.0.4 on 2026-10-18 13:50
+
+import main_app.validators
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def fill_location_counts(apps, schema_editor):
+    listing_model = apps.get_model('main_app', 'RealEstateListing')
+    location_count_model = apps.get_model('main_app', 'LocationCount')
+
+    counts = listing_model.objects.order_by().values('location').annotate(listing_count=Count('location'))
+    location_count_model.objects.bulk_create(location_count_model(**row) for row in counts)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='videogame',
+            name='rating',
+            field=models.DecimalField(decimal_places=1, max_digits=2, validators=[main_app.validators.validate_value_between_0_and_10]),
+        ),
+        migrations.AlterField(
+            model_name='videogame',
+            name='release_year',
+            field=models.PositiveIntegerField(validators=[main_app.validators.validate_value_between_1990_and_2023]),
+        ),
+        migrations.CreateModel(
+            name='LocationCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('location', models.CharField(max_length=100, unique=True)),
+                ('listing_count', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'indexes': [models.Index(models.OrderBy(models.F('listing_count'), descending=True), models.F('location'), name='location_count_leaderboard')],
+            },
+        ),
+        migrations.RunPython(fill_location_counts, reverse_code=migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.0.4 on 2026-10-18 13:50
+
+import main_app.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main_app', '0002_location_count'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='videogame',
+            name='rating',
+            field=models.DecimalField(db_index=True, decimal_places=1, max_digits=2, validators=[main_app.validators.validate_value_between_0_and_10]),
+        ),
+    ]
@@ -0,0 +1,59 @@
+from django.db import migrations
+
+POSTGRESQL_FORWARDS = [
+    'CREATE EXTENSION IF NOT EXISTS pg_trgm',
+    # Same expressions as the icontains lookup, UPPER(column::text) LIKE UPPER(pattern)
+    'CREATE INDEX task_title_trgm ON main_app_task USING gin ((UPPER(title::text)) gin_trgm_ops)',
+    'CREATE INDEX task_description_trgm ON main_app_task USING gin ((UPPER(description::text)) gin_trgm_ops)',
+]
+POSTGRESQL_BACKWARDS = [
+    'DROP INDEX IF EXISTS task_description_trgm',
+    'DROP INDEX IF EXISTS task_title_trgm',
+]
+
+# External content FTS5 table: it only stores the index, the triggers keep it in step with main_app_task
+SQLITE_FORWARDS = [
+    "CREATE VIRTUAL TABLE main_app_task_search USING fts5("
+    "title, description, content='main_app_task', content_rowid='id', tokenize='trigram')",
+    "CREATE TRIGGER main_app_task_search_insert AFTER INSERT ON main_app_task BEGIN "
+    "INSERT INTO main_app_task_search (rowid, title, description) VALUES (new.id, new.title, new.description); "
+    "END",
+    "CREATE TRIGGER main_app_task_search_delete AFTER DELETE ON main_app_task BEGIN "
+    "INSERT INTO main_app_task_search (main_app_task_search, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); "
+    "END",
+    "CREATE TRIGGER main_app_task_search_update AFTER UPDATE OF title, description ON main_app_task BEGIN "
+    "INSERT INTO main_app_task_search (main_app_task_search, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); "
+    "INSERT INTO main_app_task_search (rowid, title, description) VALUES (new.id, new.title, new.description); "
+    "END",
+    "INSERT INTO main_app_task_search (main_app_task_search) VALUES ('rebuild')",
+]
+SQLITE_BACKWARDS = [
+    'DROP TRIGGER IF EXISTS main_app_task_search_update',
+    'DROP TRIGGER IF EXISTS main_app_task_search_delete',
+    'DROP TRIGGER IF EXISTS main_app_task_search_insert',
+    'DROP TABLE IF EXISTS main_app_task_search',
+]
+
+
+def _run(statements_per_vendor: dict):
+    def run(apps, schema_editor):
+        for statement in statements_per_vendor.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(statement)
+
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main_app', '0003_videogame_rating_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            _run({'postgresql': POSTGRESQL_FORWARDS, 'sqlite': SQLITE_FORWARDS}),
+            reverse_code=_run({'postgresql': POSTGRESQL_BACKWARDS, 'sqlite': SQLITE_BACKWARDS}),
+        ),
+    ]
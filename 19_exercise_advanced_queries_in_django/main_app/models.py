@@ -5,6 +5,7 @@ from django.db import models
 from django.db.models import Q, F
 
 from main_app.managers import RealEstateListingManager, VideoGameManager
+from main_app.search import paginate, search_tasks
 from main_app.validators import validate_value_between_0_and_10, validate_value_between_1990_and_2023
 
 
@@ -27,6 +28,17 @@ class RealEstateListing(models.Model):
     objects = RealEstateListingManager()
 
 
+class LocationCount(models.Model):
+    # Number of listings per location, maintained by main_app.signals
+    location = models.CharField(max_length=100, unique=True)
+    listing_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        indexes = [
+            models.Index(F('listing_count').desc(), 'location', name='location_count_leaderboard'),
+        ]
+
+
 class VideoGame(models.Model):
     GENRE_CHOICES = [
         ('Action', 'Action'),
@@ -44,7 +56,8 @@ class VideoGame(models.Model):
     rating = models.DecimalField(
         max_digits=2,
         decimal_places=1,
-        validators=[validate_value_between_0_and_10]
+        validators=[validate_value_between_0_and_10],
+        db_index=True,
     )
     objects = VideoGameManager()
 
@@ -120,9 +133,11 @@ class Task(models.Model):
         return cls.objects.filter(query)
 
     @classmethod
-    def search_tasks(cls, query: str):
-        search_query = Q(title__icontains=query) | Q(description__icontains=query)
-        return cls.objects.filter(search_query)
+    def search_tasks(cls, query: str, page: int = None, page_size: int = 20):
+        results = search_tasks(cls.objects.all(), query)
+        if page is not None:
+            results = paginate(results, page, page_size)
+        return results
 
     @classmethod
     def recent_completed_tasks(cls, days: int):
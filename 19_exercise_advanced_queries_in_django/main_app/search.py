@@ -0,0 +1,53 @@
+from django.db import connections
+from django.db.models import Q, QuerySet
+from django.db.models.functions import Greatest
+
+# Index objects created by migration 0004_task_search_indexes
+TASK_SEARCH_TABLE = 'main_app_task_search'
+
+# Trigram indexes cannot serve patterns shorter than one trigram
+MIN_INDEXED_QUERY_LENGTH = 3
+
+
+def search_tasks(queryset: QuerySet, query: str) -> QuerySet:
+    """
+    Tasks whose title or description contains ``query`` (case-insensitive), best matches first.
+
+    PostgreSQL runs the icontains filter against pg_trgm GIN indexes on UPPER(title) and
+    UPPER(description) and ranks by trigram word similarity. SQLite goes through an FTS5
+    trigram table and ranks by bm25. Other backends keep the unranked icontains scan.
+    """
+    contains = Q(title__icontains=query) | Q(description__icontains=query)
+    vendor = connections[queryset.db].vendor
+
+    if vendor == 'postgresql':
+        # imported here because django.contrib.postgres needs psycopg on import
+        from django.contrib.postgres.search import TrigramWordSimilarity
+
+        return queryset.filter(contains).annotate(
+            search_rank=Greatest(
+                TrigramWordSimilarity(query, 'title'),
+                TrigramWordSimilarity(query, 'description'),
+            )
+        ).order_by('-search_rank', 'pk')
+
+    if vendor == 'sqlite' and len(query) >= MIN_INDEXED_QUERY_LENGTH:
+        # a quoted FTS5 string is a phrase, which the trigram tokenizer matches as a substring
+        match = '"{}"'.format(query.replace('"', '""'))
+        table = queryset.model._meta.db_table
+        # joined through extra(): a correlated rank subquery would re-run the MATCH for every row
+        return queryset.extra(
+            tables=[TASK_SEARCH_TABLE],
+            where=[f'{TASK_SEARCH_TABLE}.rowid = "{table}"."id"', f'{TASK_SEARCH_TABLE} MATCH %s'],
+            params=[match],
+            # bm25 is lower for better matches
+            select={'search_rank': f'{TASK_SEARCH_TABLE}.rank'},
+        ).order_by('search_rank', 'pk')
+
+    return queryset.filter(contains)
+
+
+def paginate(queryset: QuerySet, page: int, page_size: int) -> QuerySet:
+    # pages are numbered from 1
+    start = (page - 1) * page_size
+    return queryset[start:start + page_size]
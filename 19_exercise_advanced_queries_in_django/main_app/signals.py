@@ -0,0 +1,50 @@
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from main_app.managers import VideoGameManager
+from main_app.models import LocationCount, RealEstateListing, VideoGame
+
+
+# 01. Real Estate Listing ----------------------------------------------------------------
+# Keeps LocationCount in step with RealEstateListing rows. Queryset update()/delete() and
+# bulk_create() skip these signals - run rebuild_location_counts after them.
+
+def _add_listings(location: str, delta: int):
+    # Clamped at 0: a count that drifted low must not block deleting a listing it never counted
+    updated = LocationCount.objects.filter(location=location).update(
+        listing_count=Greatest(F('listing_count') + delta, 0))
+    if not updated and delta > 0:
+        # first listing in this location; ignore_conflicts covers a concurrent insert of the same row
+        LocationCount.objects.bulk_create([LocationCount(location=location)], ignore_conflicts=True)
+        LocationCount.objects.filter(location=location).update(listing_count=F('listing_count') + delta)
+
+
+@receiver(pre_save, sender=RealEstateListing)
+def remember_previous_location(sender, instance: RealEstateListing, **kwargs):
+    instance._previous_location = None
+    if instance.pk is not None:
+        instance._previous_location = RealEstateListing.objects.filter(pk=instance.pk).values_list(
+            'location', flat=True).first()
+
+
+@receiver(post_save, sender=RealEstateListing)
+def update_location_count_on_save(sender, instance: RealEstateListing, **kwargs):
+    previous_location = getattr(instance, '_previous_location', None)
+    if previous_location == instance.location:
+        return
+    if previous_location is not None:
+        _add_listings(previous_location, -1)
+    _add_listings(instance.location, 1)
+
+
+@receiver(post_delete, sender=RealEstateListing)
+def update_location_count_on_delete(sender, instance: RealEstateListing, **kwargs):
+    _add_listings(instance.location, -1)
+
+
+# 02. Video Games Library ----------------------------------------------------------------
+@receiver([post_save, post_delete], sender=VideoGame)
+def clear_video_game_stats_cache(sender, **kwargs):
+    VideoGameManager.clear_stats_cache()
@@ -1,3 +1,53 @@
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import call_command
 from django.test import TestCase
 
-# Create your tests here.
+from main_app.models import LocationCount, RealEstateListing
+
+
+class LocationCountTests(TestCase):
+    def create_listing(self, location: str):
+        return RealEstateListing.objects.create(
+            property_type='Flat', price=Decimal('100000.00'), bedrooms=2, location=location,
+        )
+
+    def counts(self):
+        return dict(LocationCount.objects.values_list('location', 'listing_count'))
+
+    def test_save_and_delete_keep_counts_current(self):
+        listing = self.create_listing('Sofia')
+        self.create_listing('Sofia')
+
+        listing.location = 'Varna'
+        listing.save()
+        self.assertEqual(self.counts(), {'Sofia': 1, 'Varna': 1})
+
+        listing.delete()
+        self.assertEqual(self.counts(), {'Sofia': 1, 'Varna': 0})
+
+    def test_deleting_a_bulk_created_listing_clamps_at_zero(self):
+        self.create_listing('Sofia')
+        listing = RealEstateListing.objects.bulk_create([
+            RealEstateListing(property_type='Flat', price=Decimal('90000.00'), bedrooms=1, location='Sofia'),
+        ])[0]
+        self.create_listing('Plovdiv')
+
+        RealEstateListing.objects.get(pk=listing.pk).delete()
+        RealEstateListing.objects.get(location='Sofia').delete()
+
+        self.assertEqual(self.counts(), {'Sofia': 0, 'Plovdiv': 1})
+
+    def test_rebuild_repairs_drift(self):
+        self.create_listing('Sofia')
+        RealEstateListing.objects.bulk_create([
+            RealEstateListing(property_type='Flat', price=Decimal('90000.00'), bedrooms=1, location='Sofia'),
+        ])
+
+        call_command('rebuild_location_counts', stdout=StringIO())
+
+        self.assertEqual(self.counts(), {'Sofia': 2})
+        self.assertEqual(
+            list(RealEstateListing.objects.popular_locations()), [{'location': 'Sofia', 'location_count': 2}],
+        )
@@ -0,0 +1,69 @@
+"""Added recipe ingredient search indexes
+
+Revision ID: 9f1c2d7a4b3e
+Revises: 4c36d3e89740
+Create Date: 2026-10-18 14:05:12.417309
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9f1c2d7a4b3e'
+down_revision: Union[str, None] = '4c36d3e89740'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'postgresql':
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        op.create_index(
+            'ix_recipes_ingredients_trgm',
+            'recipes',
+            ['ingredients'],
+            postgresql_using='gin',
+            postgresql_ops={'ingredients': 'gin_trgm_ops'},
+        )
+
+    elif dialect == 'sqlite':
+        # External content FTS5 table: it only stores the index, the triggers keep it in step with recipes
+        op.execute(
+            "CREATE VIRTUAL TABLE recipes_search USING fts5("
+            "ingredients, content='recipes', content_rowid='id', tokenize='trigram')"
+        )
+        op.execute(
+            "CREATE TRIGGER recipes_search_insert AFTER INSERT ON recipes BEGIN "
+            "INSERT INTO recipes_search (rowid, ingredients) VALUES (new.id, new.ingredients); "
+            "END"
+        )
+        op.execute(
+            "CREATE TRIGGER recipes_search_delete AFTER DELETE ON recipes BEGIN "
+            "INSERT INTO recipes_search (recipes_search, rowid, ingredients) VALUES ('delete', old.id, old.ingredients); "
+            "END"
+        )
+        op.execute(
+            "CREATE TRIGGER recipes_search_update AFTER UPDATE OF ingredients ON recipes BEGIN "
+            "INSERT INTO recipes_search (recipes_search, rowid, ingredients) VALUES ('delete', old.id, old.ingredients); "
+            "INSERT INTO recipes_search (rowid, ingredients) VALUES (new.id, new.ingredients); "
+            "END"
+        )
+        op.execute("INSERT INTO recipes_search (recipes_search) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'postgresql':
+        op.drop_index('ix_recipes_ingredients_trgm', table_name='recipes')
+
+    elif dialect == 'sqlite':
+        op.execute('DROP TRIGGER IF EXISTS recipes_search_update')
+        op.execute('DROP TRIGGER IF EXISTS recipes_search_delete')
+        op.execute('DROP TRIGGER IF EXISTS recipes_search_insert')
+        op.execute('DROP TABLE IF EXISTS recipes_search')
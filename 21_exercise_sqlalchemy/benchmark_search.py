@@ -0,0 +1,66 @@
+import random
+import sys
+import time
+
+from caller import session
+from models import Recipe
+from search import search_recipes_by_ingredient
+
+#   python benchmark_search.py seed 10000000
+#   python benchmark_search.py run
+
+BATCH_SIZE = 10_000
+REPEATS = 5
+INGREDIENTS = ['Chicken', 'Beef', 'Pasta', 'Eggs', 'Cheese', 'Tomatoes', 'Onions', 'Garlic', 'Rice', 'Potatoes']
+QUERIES = ['saffron', 'Chicken', 'Recipe 4242', 'zzz-no-match']
+
+
+def seed_recipes(total: int):
+    rng = random.Random(0)
+    existing = session.query(Recipe).count()
+
+    for start in range(existing, total, BATCH_SIZE):
+        session.execute(
+            Recipe.__table__.insert(),
+            [
+                {
+                    'name': f'Recipe {number}',
+                    'ingredients': ', '.join(rng.sample(INGREDIENTS, 4)) + (', Saffron' if number % 1000 == 0 else ''),
+                    'instructions': 'Mix and cook',
+                }
+                for number in range(start, min(start + BATCH_SIZE, total))
+            ],
+        )
+        session.commit()
+
+
+def ilike_search(ingredient_name: str) -> list:
+    # get_recipes_by_ingredient before the search indexes
+    return session.query(Recipe).filter(Recipe.ingredients.ilike(f"%{ingredient_name}%")).limit(20).all()
+
+
+def indexed_search(ingredient_name: str) -> list:
+    return search_recipes_by_ingredient(session, ingredient_name, page=1)
+
+
+def measure(name: str, search, query: str):
+    started = time.perf_counter()
+    for _ in range(REPEATS):
+        first_page = search(query)
+    elapsed = (time.perf_counter() - started) / REPEATS
+    print(f'{name:>7} {query!r:>16}: {len(first_page)} results on page 1, {elapsed * 1000:.1f} ms')
+
+
+if __name__ == '__main__':
+    mode = sys.argv[1] if len(sys.argv) > 1 else 'run'
+
+    if mode == 'seed':
+        seed_recipes(int(sys.argv[2]) if len(sys.argv) > 2 else 10_000_000)
+        print(f'Recipes in table: {session.query(Recipe).count()}')
+        sys.exit()
+
+    print(f'Recipes in table: {session.query(Recipe).count()}')
+    for query in QUERIES:
+        measure('ilike', ilike_search, query)
+        measure('indexed', indexed_search, query)
+    session.close()
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, Index
 from sqlalchemy.orm import declarative_base, relationship
 
 Base = declarative_base()
@@ -14,6 +14,16 @@ class Recipe(Base):
     chef_id = Column(Integer, ForeignKey("chefs.id"))
     chef = relationship("Chef", back_populates="recipes")
 
+    __table_args__ = (
+        # pg_trgm index serving ingredients ILIKE '%...%'; SQLite uses the recipes_search FTS5 table instead
+        Index(
+            'ix_recipes_ingredients_trgm',
+            'ingredients',
+            postgresql_using='gin',
+            postgresql_ops={'ingredients': 'gin_trgm_ops'},
+        ),
+    )
+
 
 class Chef(Base):
     __tablename__ = 'chefs'
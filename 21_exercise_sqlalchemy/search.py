@@ -0,0 +1,41 @@
+from typing import List
+
+from sqlalchemy import Float, Integer, func, text
+
+from models import Recipe
+
+# Created by the "Added recipe ingredient search indexes" migration
+RECIPE_SEARCH_TABLE = 'recipes_search'
+
+# Trigram indexes cannot serve patterns shorter than one trigram
+MIN_INDEXED_QUERY_LENGTH = 3
+
+
+def search_recipes_by_ingredient(session, ingredient_name: str, page: int = None, page_size: int = 20) -> List:
+    """
+    Recipes whose ingredients contain ``ingredient_name`` (case-insensitive), best matches first.
+
+    PostgreSQL runs the ILIKE against the pg_trgm GIN index and ranks by word similarity.
+    SQLite matches through the FTS5 trigram table and ranks by bm25. Pages are numbered from 1.
+    """
+    query = session.query(Recipe).filter(Recipe.ingredients.ilike(f"%{ingredient_name}%"))
+    dialect = session.get_bind().dialect.name
+
+    if dialect == 'postgresql':
+        query = query.order_by(func.word_similarity(ingredient_name, Recipe.ingredients).desc(), Recipe.id)
+
+    elif dialect == 'sqlite' and len(ingredient_name) >= MIN_INDEXED_QUERY_LENGTH:
+        # a quoted FTS5 string is a phrase, which the trigram tokenizer matches as a substring
+        match = '"{}"'.format(ingredient_name.replace('"', '""'))
+        matches = text(
+            f"SELECT rowid AS recipe_id, rank FROM {RECIPE_SEARCH_TABLE} WHERE {RECIPE_SEARCH_TABLE} MATCH :match"
+        ).bindparams(match=match).columns(recipe_id=Integer, rank=Float).subquery()
+        # bm25 is lower for better matches
+        query = session.query(Recipe).join(matches, matches.c.recipe_id == Recipe.id).order_by(
+            matches.c.rank, Recipe.id
+        )
+
+    if page is not None:
+        query = query.offset((page - 1) * page_size).limit(page_size)
+
+    return query.all()